@@ -0,0 +1,1007 @@
+##################################################
+# asyncio versions of the BlizzPy client         #
+# classes, e.g. AsyncWoWCharacter, AsyncWoWGuild, #
+# AsyncSC2Profile, AsyncD3Profile.               #
+# AsyncTransport: Pooled aiohttp sessions.       #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import asyncio
+import json
+from urllib.parse import urlsplit
+
+try:
+	import aiohttp
+
+except ImportError:
+	aiohttp = None
+
+from .ratelimit import get_default_rate_limiter
+from .cache import MemoryCache, default_max_bytes, default_max_entry_bytes, cache_key, cache_ttl, entry_from_response, get_shared_cache
+from .retry import RetryPolicy, CircuitBreaker
+from .auction import AuctionSnapshot, AuctionSnapshotBuilder
+from .files import atomic_write
+from .news import guild_key
+from .stream import JSONArrayParser
+from .transport import BlizzardAPIError, RateLimitError, ServiceUnavailableError, CircuitOpenError, transient_error, redact_url
+from .wow import character_fields, load_auction_dump, WoWCharacter, WoWGuild, WoWAuction, WoWPets, WoWPVP, WoWResources
+from .sc2 import SC2Profile, SC2Ladder, SC2Resources
+from .d3 import D3Profile, D3General
+
+
+#
+class AsyncTransport:
+
+	"""The asyncio counterpart of blizzpy.transport.Transport. Keeps a single pooled keep-alive aiohttp session
+	   (limited per host, i.e. per region) for the event loop it is used in. Requires aiohttp.
+
+	   PARAMS:
+	   limit: Maximum number of open connections in total.
+	   limit_per_host: Maximum number of open connections kept alive per host.
+	   timeout: Timeout (in seconds) for each request.
+	   rate_limiter: RateLimiter every request goes through. If None, use the process-wide default RateLimiter.
+	   retry: RetryPolicy of requests that fail with a transient error. If None, use RetryPolicy().
+	   failure_threshold: Number of consecutive transient failures of a region that opens its circuit breaker.
+	   reset_timeout: Number of seconds an open circuit breaker fails requests to its region immediately.
+	   cache: Cache of decoded responses and their validators (ETag/Last-Modified), e.g. a MemoryCache or a
+	          SQLiteCache. If None, use the process-wide shared cache if it is turned on (see enable_shared_cache()),
+	          or a MemoryCache of this transport otherwise, which holds at most 64 MB of responses of 2 MB or less.
+	   conditional: If True, revalidate cached responses with conditional requests, and reuse the cached data
+	                when the API answers "304 Not Modified"."""
+	def __init__(self, limit=100, limit_per_host=16, timeout=30, rate_limiter=None, retry=None,
+		failure_threshold=5, reset_timeout=30, cache=None, conditional=True):
+		if aiohttp is None:
+			raise ImportError("AsyncTransport requires aiohttp. Install it with: pip install aiohttp")
+			return
+
+		self.limit = limit
+		self.limit_per_host = limit_per_host
+		self.timeout = timeout
+		self.rate_limiter = rate_limiter
+		self.retry = retry if retry is not None else RetryPolicy()
+		self.failure_threshold = failure_threshold
+		self.reset_timeout = reset_timeout
+		self.cache = cache
+		self.conditional = conditional
+
+		self._session = None
+		self._loop = None
+		self._breakers = {}
+		self._own_cache = MemoryCache(max_bytes=default_max_bytes, max_entry_bytes=default_max_entry_bytes)
+		self._flights = {}
+
+
+	"""Return the pooled session of the running event loop, creating it on first use."""
+	def _get_session(self):
+		loop = asyncio.get_running_loop()
+
+		if self._session is None or self._session.closed or self._loop is not loop:
+			connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+			self._session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout))
+			self._loop = loop
+
+		return self._session
+
+
+	"""Return the cache of this transport."""
+	def _get_cache(self):
+		if self.cache is not None:
+			return self.cache
+
+		shared_cache = get_shared_cache()
+
+		return shared_cache if shared_cache is not None else self._own_cache
+
+
+	"""Wait until the rate limiter allows another request, without blocking the event loop."""
+	async def _acquire(self):
+		rate_limiter = self.rate_limiter if self.rate_limiter is not None else get_default_rate_limiter()
+		wait = rate_limiter.reserve()
+
+		if wait > 0:
+			await asyncio.sleep(wait)
+
+
+	"""Return the circuit breaker of the host (i.e. region) of URL, creating it on first use."""
+	def get_circuit_breaker(self, url):
+		host = urlsplit(url).netloc
+
+		if host not in self._breakers:
+			self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+
+		return self._breakers[host]
+
+
+	"""Send a GET request to URL with the extra HEADERS once the rate limiter allows it, and return a
+	   (status, headers, body) tuple of the response. Transient failures are retried according to self.retry.
+	   If STREAM is True, return the aiohttp response with its body unread instead (the caller must release it),
+	   and only time out when reading the body stalls for self.timeout seconds.
+
+	   Raises RateLimitError or ServiceUnavailableError if the request still fails after every retry,
+	   CircuitOpenError if the region's circuit breaker is open, or aiohttp.ClientResponseError for any other error status."""
+	async def get(self, url, headers=None, stream=False):
+		breaker = self.get_circuit_breaker(url)
+		# Streamed bodies may take longer than self.timeout as a whole. Other requests keep the session's timeout.
+		options = {'timeout': aiohttp.ClientTimeout(total=None, sock_read=self.timeout)} if stream else {}
+		attempt = 0
+
+		while True:
+			if not breaker.allow():
+				raise CircuitOpenError("Blizzard API region is failing, not sending request: " + redact_url(url))
+				return
+
+			try:
+				await self._acquire()
+
+				try:
+					response = await self._get_session().get(url, headers=headers, **options)
+					error = transient_error(response.status, url, response.headers)
+
+					if error is not None:
+						response.release()
+
+					elif not stream:
+						try:
+							body = await response.read()
+
+						finally:
+							response.release()
+
+				except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as e:
+					error = ServiceUnavailableError("Could not reach the Blizzard API (" + type(e).__name__ + "): " + redact_url(url))
+
+			# Any other error (e.g. a cancellation) says nothing about the region, but must not leave a trial request
+			# in flight forever.
+			except:
+				breaker.release_trial()
+				raise
+
+			if error is None:
+				breaker.record_success()
+				response.raise_for_status()
+
+				if stream:
+					return response
+
+				return response.status, response.headers, body
+
+			# A 429 means the region is up, but this API key is over its quota.
+			if isinstance(error, RateLimitError):
+				breaker.record_success()
+
+			else:
+				breaker.record_failure()
+
+			if attempt >= self.retry.max_retries:
+				raise error
+				return
+
+			await asyncio.sleep(self.retry.delay(attempt, getattr(error, 'retry_after', None)))
+			attempt += 1
+
+
+	"""Yield the body of URL in chunks of at most CHUNK_SIZE bytes as it downloads, without caching it,
+	   like Transport.stream()."""
+	async def stream(self, url, chunk_size=64 * 1024):
+		response = await self.get(url, stream=True)
+
+		try:
+			async for chunk in response.content.iter_chunked(chunk_size):
+				yield chunk
+
+		finally:
+			response.release()
+
+
+	"""Return the body of URL decoded from json. Cached responses are revalidated with conditional requests, and
+	   concurrent calls for the same URL are coalesced into a single request, like Transport.get_json()."""
+	async def get_json(self, url):
+		key = cache_key(url)
+		flight = self._flights.get(key)
+
+		if flight is None:
+			flight = asyncio.ensure_future(self._get_json(url))
+			self._flights[key] = flight
+			flight.add_done_callback(lambda _: self._flights.pop(key, None))
+
+		# Shielded, so that a cancelled caller does not cancel the request shared by the other callers.
+		return await asyncio.shield(flight)
+
+
+	"""Return the body of URL decoded from json. See get_json()."""
+	async def _get_json(self, url):
+		if not self.conditional:
+			status, headers, body = await self.get(url)
+
+			return json.loads(body)
+
+		cache = self._get_cache()
+		key = cache_key(url)
+		entry = cache.get(key)
+
+		if entry is not None and entry.is_fresh():
+			return entry.data
+
+		status, headers, body = await self.get(url, entry.validators() if entry is not None else None)
+
+		if status == 304 and entry is not None:
+			entry.refresh(cache_ttl(cache, url))
+			cache.set(key, entry)
+
+			return entry.data
+
+		data = json.loads(body)
+		entry = entry_from_response(data, headers, len(body), cache_ttl(cache, url))
+
+		if entry is not None:
+			cache.set(key, entry)
+
+		return data
+
+
+	"""Close the pooled session and the connections it holds."""
+	async def close(self):
+		if self._session is not None:
+			await self._session.close()
+
+		self._session = None
+		self._loop = None
+
+
+# The process-wide transport used by every async client class that isn't given its own.
+_default_async_transport = None
+
+
+"""Return the process-wide default AsyncTransport, creating it on first use."""
+def get_default_async_transport():
+	global _default_async_transport
+
+	if _default_async_transport is None:
+		_default_async_transport = AsyncTransport()
+
+	return _default_async_transport
+
+
+"""Replace the process-wide default AsyncTransport with TRANSPORT."""
+def set_default_async_transport(transport):
+	global _default_async_transport
+
+	_default_async_transport = transport
+
+
+#
+class _AsyncClient:
+
+	"""Shared request logic of the async client classes. Each async class inherits the URL builders and
+	   data processing methods of its sync class, and only replaces the get_X_data() methods with coroutines."""
+	_error_msg = "Could not retrieve data. Please check your API key."
+
+
+	"""Return TRANSPORT, or the process-wide AsyncTransport if TRANSPORT is None."""
+	@staticmethod
+	def _async_transport(transport):
+		return transport if transport is not None else get_default_async_transport()
+
+
+	"""Return the json data of URL, narrowed down by KEYS, e.g. ['pvp', 'brackets']."""
+	async def _fetch(self, url, keys=None):
+		try:
+			data = await self.transport.get_json(url)
+
+			for key in keys or []:
+				data = data[key]
+
+			return data
+
+		except BlizzardAPIError:
+			raise
+
+		except Exception:
+			raise ValueError(self._error_msg)
+			return
+
+
+#
+class AsyncWoWCharacter(_AsyncClient, WoWCharacter):
+
+	"""asyncio version of WoWCharacter. Every get_X_data() method is a coroutine, e.g.
+	   await MyCharacter.get_items_data(). Other methods work on the data fetched by those coroutines."""
+	_error_msg = "Could not retrieve data. Please check your API key, character name, or realm name."
+
+	def __init__(self, api_key, characterName, realm, locale="en_US", token=None, transport=None):
+		super().__init__(api_key, characterName, realm, locale, token, self._async_transport(transport))
+
+
+	"""Coroutine version of get_character_data()."""
+	async def get_character_data(self):
+		self.character_data = await self._fetch(self._get_data_url())
+
+		return self.character_data
+
+
+	"""Coroutine version of prefetch()."""
+	async def prefetch(self, fields=None):
+		fields = self._check_fields(fields)
+
+		return self._fill_fields(fields, await self._fetch(self._get_data_with_field_url(",".join(fields))))
+
+
+	"""Coroutine version of load_all()."""
+	async def load_all(self):
+		return await self.prefetch()
+
+
+	"""Async generator version of fetch_many(), e.g.
+	   async for character, error in AsyncWoWCharacter.fetch_many(api_key, characters). Fetches at most MAX_CONCURRENCY
+	   characters at once, as tasks of the running event loop, and reads CHARACTERS lazily."""
+	@classmethod
+	async def fetch_many(cls, api_key, characters, fields=None, locale="en_US", max_concurrency=8, token=None, transport=None):
+		if max_concurrency < 1:
+			raise ValueError("max_concurrency must be at least 1.")
+			return
+
+		if fields is not None:
+			fields = cls._check_fields(fields)
+
+		async def fetch(character):
+			if fields is None:
+				await character.get_character_data()
+
+			else:
+				await character.prefetch(fields)
+
+		characters = iter(characters)
+		pending = {}
+
+		try:
+			while True:
+				for characterName, realm in characters:
+					character = cls(api_key, characterName, realm, locale, token, transport)
+					pending[asyncio.ensure_future(fetch(character))] = character
+
+					if len(pending) >= max_concurrency:
+						break
+
+				if not pending:
+					break
+
+				done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+				for task in done:
+					yield pending.pop(task), task.exception()
+
+		# The caller stopped iterating, or was cancelled: don't leave the remaining fetches running.
+		finally:
+			for task in pending:
+				task.cancel()
+
+
+	"""Fetch the single FIELD, and return its dataset."""
+	async def _get_field_data(self, field):
+		await self.prefetch([field])
+
+		return getattr(self, character_fields[field][0])
+
+
+	"""Coroutine version of get_achievements_data()."""
+	async def get_achievements_data(self):
+		return await self._get_field_data("achievements")
+
+
+	"""Coroutine version of get_appearance_data()."""
+	async def get_appearance_data(self):
+		return await self._get_field_data("appearance")
+
+
+	"""Coroutine version of get_feed_data()."""
+	async def get_feed_data(self):
+		return await self._get_field_data("feed")
+
+
+	"""Coroutine version of get_guild_data()."""
+	async def get_guild_data(self):
+		return await self._get_field_data("guild")
+
+
+	"""Coroutine version of get_items_data()."""
+	async def get_items_data(self):
+		return await self._get_field_data("items")
+
+
+	"""Coroutine version of get_mounts_data()."""
+	async def get_mounts_data(self):
+		return await self._get_field_data("mounts")
+
+
+	"""Coroutine version of get_pets_data()."""
+	async def get_pets_data(self):
+		return await self._get_field_data("pets")
+
+
+	"""Coroutine version of get_professions_data()."""
+	async def get_professions_data(self):
+		return await self._get_field_data("professions")
+
+
+	"""Coroutine version of get_raid_prog_data()."""
+	async def get_raid_prog_data(self):
+		return await self._get_field_data("progression")
+
+
+	"""Coroutine version of get_pvp_data()."""
+	async def get_pvp_data(self):
+		return await self._get_field_data("pvp")
+
+
+	"""Coroutine version of get_reputation_data()."""
+	async def get_reputation_data(self):
+		return await self._get_field_data("reputation")
+
+
+	"""Coroutine version of get_quests_data()."""
+	async def get_quests_data(self):
+		return await self._get_field_data("quests")
+
+
+	"""Coroutine version of get_statistics_data()."""
+	async def get_statistics_data(self):
+		return await self._get_field_data("statistics")
+
+
+	"""Coroutine version of get_stats_data()."""
+	async def get_stats_data(self):
+		return await self._get_field_data("stats")
+
+
+	"""Coroutine version of get_talents_data()."""
+	async def get_talents_data(self):
+		return await self._get_field_data("talents")
+
+
+	"""Coroutine version of get_titles_data()."""
+	async def get_titles_data(self):
+		return await self._get_field_data("titles")
+
+
+
+	"""Coroutine version of get_hunter_pet_data()."""
+	async def get_hunter_pet_data(self):
+		if not self.character_data:
+			await self.get_character_data()
+
+		if self.get_class() != "Hunter":
+			raise ValueError(self.characterName + "-" + self.realm + " is not a Hunter.")
+			return
+
+		return await self._get_field_data("hunterPets")
+
+
+#
+class AsyncWoWGuild(_AsyncClient, WoWGuild):
+
+	"""asyncio version of WoWGuild."""
+	_error_msg = "Could not retrieve data. Please check your API key, guild name, or realm name."
+
+	def __init__(self, api_key, guild_name, realm, locale="en_US", token=None, transport=None):
+		super().__init__(api_key, guild_name, realm, locale, token, self._async_transport(transport))
+
+
+	"""Coroutine version of get_guild_data()."""
+	async def get_guild_data(self):
+		self.guild_data = await self._fetch(self._get_data_url())
+
+		return self.guild_data
+
+
+	"""Coroutine version of get_members_data()."""
+	async def get_members_data(self):
+		self.members_data = await self._fetch(self._get_data_with_field_url("members"), ['members'])
+
+		return self.members_data
+
+
+	"""Unlike the sync version, can't retrieve the roster, since that takes a coroutine: raise ValueError if it
+	   wasn't retrieved yet, instead of answering roster queries on an empty roster."""
+	def _load_members(self):
+		if not self.members_data:
+			raise ValueError("No roster retrieved yet. Call await get_members_data() first.")
+			return
+
+
+	"""Async generator version of enrich_members(), e.g.
+	   async for member, character, error in MyGuild.enrich_members(["items"]). CHARACTER is an AsyncWoWCharacter."""
+	async def enrich_members(self, fields=None, max_concurrency=8):
+		if not self.members_data:
+			await self.get_members_data()
+
+		members = self._get_unique_members()
+
+		async for character, error in AsyncWoWCharacter.fetch_many(self.api_key, members, fields, self.locale, max_concurrency,
+			transport=self.transport):
+			yield members[(character.characterName, character.realm)], character, error
+
+
+	"""Coroutine version of get_roster_changes()."""
+	async def get_roster_changes(self, path=None):
+		await self.get_members_data()
+
+		return self._track_roster(path)
+
+
+	"""Coroutine version of get_achievements_data()."""
+	async def get_achievements_data(self):
+		self.ach_data = await self._fetch(self._get_data_with_field_url("achievements"), ['achievements'])
+
+		return self.ach_data
+
+
+	"""Coroutine version of get_guild_news_data()."""
+	async def get_guild_news_data(self):
+		self.news_data = await self._fetch(self._get_data_with_field_url("news"), ['news'])
+
+		return self.news_data
+
+
+	"""Coroutine version of get_new_guild_news()."""
+	async def get_new_guild_news(self, cursor=None):
+		await self.get_guild_news_data()
+
+		return (cursor if cursor is not None else self.news_cursor).new_entries(guild_key(self.guild_name, self.realm), self.news_data)
+
+
+	"""Coroutine version of get_guild_challenge_data()."""
+	async def get_guild_challenge_data(self):
+		self.challenge_data = await self._fetch(self._get_data_with_field_url("challenge"), ['challenge'])
+
+		return self.challenge_data
+
+
+
+#
+class AsyncWoWAuction(_AsyncClient, WoWAuction):
+
+	"""asyncio version of WoWAuction."""
+	_error_msg = "Could not retrieve data. Please check your API key or realm."
+
+	def __init__(self, api_key, realm, locale="en_US", token=None, transport=None):
+		super().__init__(api_key, realm, locale, token, self._async_transport(transport))
+
+
+	"""Coroutine version of get_auction_data()."""
+	async def get_auction_data(self, dump_path=None):
+		if dump_path is not None:
+			await self.download_auction_data(dump_path)
+
+			self.auction_data = load_auction_dump(dump_path)
+			self.snapshot = None
+			self._snapshot_auctions = None
+
+			return self.auction_data
+
+		files = await self._fetch(self._get_auction_data_url(), ['files'])
+		self.last_modified = files[0]['lastModified']
+
+		self.auction_data = await self._fetch(files[0]['url'], ['auctions'])
+		self.snapshot = None
+		self._snapshot_auctions = None
+
+		return self.auction_data
+
+
+	"""Coroutine version of download_auction_data()."""
+	async def download_auction_data(self, path):
+		files = await self._fetch(self._get_auction_data_url(), ['files'])
+		self.last_modified = files[0]['lastModified']
+
+		with atomic_write(path) as f:
+			async for chunk in self.transport.stream(files[0]['url']):
+				f.write(chunk)
+
+		return self.last_modified
+
+
+	"""Async generator version of iter_auctions(), e.g. async for auction in MyAuction.iter_auctions()."""
+	async def iter_auctions(self):
+		files = await self._fetch(self._get_auction_data_url(), ['files'])
+		self.last_modified = files[0]['lastModified']
+
+		parser = JSONArrayParser('auctions')
+
+		async for chunk in self.transport.stream(files[0]['url']):
+			for auction in parser.feed(chunk):
+				yield auction
+
+			if parser.done:
+				break
+
+		for auction in parser.close():
+			yield auction
+
+
+	"""Coroutine version of check_last_modified()."""
+	async def check_last_modified(self):
+		files = await self._fetch(self._get_auction_data_url(), ['files'])
+
+		return files[0]['lastModified']
+
+
+	"""Coroutine version of get_snapshot()."""
+	async def get_snapshot(self):
+		builder = AuctionSnapshotBuilder()
+
+		async for auction in self.iter_auctions():
+			builder.append(auction)
+
+		self.snapshot = builder.build(self.last_modified)
+		self._snapshot_auctions = None
+
+		return self.snapshot
+
+
+	"""Coroutine version of get_snapshot_diff()."""
+	async def get_snapshot_diff(self):
+		previous = self.snapshot if self.snapshot is not None else AuctionSnapshot.from_auctions([])
+
+		return (await self.get_snapshot()).diff(previous)
+
+
+	"""Return self.snapshot, or a snapshot of self.auction_data, like WoWAuction._get_snapshot(). The auction data
+	   can't be retrieved here, since that takes a coroutine: raise ValueError if none was retrieved yet."""
+	def _get_snapshot(self, full=False):
+		if self.snapshot is None and not self.auction_data:
+			raise ValueError("No auction data retrieved yet. Call await get_snapshot() or await get_auction_data() first.")
+			return
+
+		return super()._get_snapshot(full)
+
+
+#
+class AsyncWoWPets(_AsyncClient, WoWPets):
+
+	"""asyncio version of WoWPets."""
+	def __init__(self, api_key, locale="en_US", token=None, transport=None):
+		super().__init__(api_key, locale, token, self._async_transport(transport))
+
+
+	"""Coroutine version of get_master_list()."""
+	async def get_master_list(self):
+		self.master_data = await self._fetch(self._get_master_data_url(), ['pets'])
+
+		return self.master_data
+
+
+	"""Coroutine version of get_ability_data()."""
+	async def get_ability_data(self, abilityId):
+		self.ability_data = await self._fetch(self._get_ability_data_url(abilityId))
+
+		return self.ability_data
+
+
+	"""Coroutine version of get_species_data()."""
+	async def get_species_data(self, speciesId):
+		self.species_data = await self._fetch(self._get_species_data_url(speciesId))
+
+		return self.species_data
+
+
+	"""Coroutine version of get_species_stats_data()."""
+	async def get_species_stats_data(self, speciesId, level=1, breedId=3, qualityId=1):
+		self.ability_data = await self._fetch(self._get_stats_data_url(speciesId, level, breedId, qualityId))
+
+		return self.ability_data
+
+
+
+#
+class AsyncWoWPVP(_AsyncClient, WoWPVP):
+
+	"""asyncio version of WoWPVP."""
+	def __init__(self, api_key, locale="en_US", token=None, transport=None):
+		super().__init__(api_key, locale, token, self._async_transport(transport))
+
+
+	"""Coroutine version of get_2v2_data()."""
+	async def get_2v2_data(self):
+		self.pvp_2v2_data = await self._fetch(self._get_pvp_data_url("2v2"))
+
+		return self.pvp_2v2_data
+
+
+	"""Coroutine version of get_3v3_data()."""
+	async def get_3v3_data(self):
+		self.pvp_3v3_data = await self._fetch(self._get_pvp_data_url("3v3"))
+
+		return self.pvp_3v3_data
+
+
+	"""Coroutine version of get_rbg_data()."""
+	async def get_rbg_data(self):
+		self.pvp_rbg_data = await self._fetch(self._get_pvp_data_url("rbg"))
+
+		return self.pvp_rbg_data
+
+
+
+#
+class AsyncWoWResources(_AsyncClient, WoWResources):
+
+	"""asyncio version of WoWResources."""
+	def __init__(self, api_key, locale="en_US", token=None, transport=None):
+		super().__init__(api_key, locale, token, self._async_transport(transport))
+
+
+	"""Coroutine version of get_achievement_data()."""
+	async def get_achievement_data(self, achievement_id):
+		self.achievement_data = await self._fetch(self._get_achievement_data_url(achievement_id))
+
+		return self.achievement_data
+
+
+	"""Coroutine version of get_bosses_data()."""
+	async def get_bosses_data(self):
+		self.bosses_data = await self._fetch(self._get_boss_master_url())
+
+		return self.bosses_data
+
+
+	"""Coroutine version of get_boss_info()."""
+	async def get_boss_info(self, boss_id):
+		self.boss_data = await self._fetch(self._get_boss_data_url(boss_id))
+
+		return self.boss_data
+
+
+	"""Coroutine version of get_item_data()."""
+	async def get_item_data(self, item_id):
+		self.item_data = await self._fetch(self._get_item_data_url(item_id))
+
+		return self.item_data
+
+
+	"""Coroutine version of get_item_set_data()."""
+	async def get_item_set_data(self, itemSet_id):
+		self.item_set_data = await self._fetch(self._get_item_set_data_url(itemSet_id))
+
+		return self.item_set_data
+
+
+	"""Coroutine version of get_mounts_data()."""
+	async def get_mounts_data(self):
+		self.mounts_data = await self._fetch(self._get_mount_master_url())
+
+		return self.mounts_data
+
+
+	"""Coroutine version of get_quest_data()."""
+	async def get_quest_data(self, quest_id):
+		self.quest_data = await self._fetch(self._get_quest_data_url(quest_id))
+
+		return self.quest_data
+
+
+	"""Coroutine version of get_realms_data()."""
+	async def get_realms_data(self):
+		self.realms_data = await self._fetch(self._get_realms_data_url())
+
+		return self.realms_data
+
+
+	"""Coroutine version of get_recipe_data()."""
+	async def get_recipe_data(self, recipe_id):
+		self.recipe_data = await self._fetch(self._get_recipe_data_url(recipe_id))
+
+		return self.recipe_data
+
+
+	"""Coroutine version of get_spell_data()."""
+	async def get_spell_data(self, spell_id):
+		self.spell_data = await self._fetch(self._get_spell_data_url(spell_id))
+
+		return self.spell_data
+
+
+	"""Coroutine version of get_zones_data()."""
+	async def get_zones_data(self):
+		self.zones_data = await self._fetch(self._get_zone_master_url())
+
+		return self.zones_data
+
+
+	"""Coroutine version of get_zone_info()."""
+	async def get_zone_info(self, zone_id):
+		self.zone_data = await self._fetch(self._get_zone_data_url(zone_id))
+
+		return self.zone_data
+
+
+
+#
+class AsyncSC2Profile(_AsyncClient, SC2Profile):
+
+	"""asyncio version of SC2Profile."""
+	_error_msg = "Could not retrieve data. Please check your API key, profile ID, region ID, or profile name."
+
+	def __init__(self, api_key, profile_id, profile_name, region_id=1, locale="en_US", token=None, transport=None):
+		super().__init__(api_key, profile_id, profile_name, region_id, locale, token, self._async_transport(transport))
+
+
+	"""Coroutine version of get_profile_data()."""
+	async def get_profile_data(self):
+		self.profile_data = await self._fetch(self._get_profile_data_url())
+
+		return self.profile_data
+
+
+	"""Coroutine version of get_profile_ladder_data()."""
+	async def get_profile_ladder_data(self):
+		self.ladders_data = await self._fetch(self._get_profile_ladders_data_url())
+
+		return self.ladders_data
+
+
+	"""Coroutine version of get_match_history_data()."""
+	async def get_match_history_data(self):
+		self.match_history = await self._fetch(self._get_match_history_data_url())
+
+		return self.match_history
+
+
+
+#
+class AsyncSC2Ladder(_AsyncClient, SC2Ladder):
+
+	"""asyncio version of SC2Ladder."""
+	_error_msg = "Could not retrieve data. Please check your API key or ladder ID."
+
+	def __init__(self, api_key, ladder_id, locale="en_US", token=None, transport=None):
+		super().__init__(api_key, ladder_id, locale, token, self._async_transport(transport))
+
+
+	"""Coroutine version of get_ladder_data()."""
+	async def get_ladder_data(self):
+		self.ladder_data = await self._fetch(self._get_ladder_data_url())
+
+		return self.ladder_data
+
+
+
+#
+class AsyncSC2Resources(_AsyncClient, SC2Resources):
+
+	"""asyncio version of SC2Resources."""
+	def __init__(self, api_key, locale="en_US", token=None, transport=None):
+		super().__init__(api_key, locale, token, self._async_transport(transport))
+
+
+	"""Coroutine version of get_achievements_data()."""
+	async def get_achievements_data(self):
+		self.achievements_data = await self._fetch(self._get_achievements_data_url())
+
+		return self.achievements_data
+
+
+	"""Coroutine version of get_rewards_data()."""
+	async def get_rewards_data(self):
+		self.rewards_data = await self._fetch(self._get_rewards_data_url())
+
+		return self.rewards_data
+
+
+
+#
+class AsyncD3Profile(_AsyncClient, D3Profile):
+
+	"""asyncio version of D3Profile."""
+	_error_msg = "Could not retrieve data. Please check your API key, battle tag, or hero ID."
+
+	def __init__(self, api_key, battle_tag, locale="en_US", token=None, transport=None):
+		super().__init__(api_key, battle_tag, locale, token, self._async_transport(transport))
+
+
+	"""Coroutine version of get_profile_data()."""
+	async def get_profile_data(self):
+		self.profile_data = await self._fetch(self._get_profile_data_url())
+
+		return self.profile_data
+
+
+	"""Coroutine version of get_hero_data()."""
+	async def get_hero_data(self, hero_id):
+		self.hero_data = await self._fetch(self._get_hero_data_url(hero_id))
+
+		return self.hero_data
+
+
+	"""Coroutine version of get_hero_items_data()."""
+	async def get_hero_items_data(self, hero_id):
+		self.hero_items_data = await self._fetch(self._get_hero_items_data_url(hero_id))
+
+		return self.hero_items_data
+
+
+	"""Coroutine version of get_follower_items_data()."""
+	async def get_follower_items_data(self, hero_id):
+		self.follower_items_data = await self._fetch(self._get_follower_items_data_url(hero_id))
+
+		return self.follower_items_data
+
+
+
+#
+class AsyncD3General(_AsyncClient, D3General):
+
+	"""asyncio version of D3General."""
+	def __init__(self, api_key, locale="en_US", token=None, transport=None):
+		super().__init__(api_key, locale, token, self._async_transport(transport))
+
+
+	"""Coroutine version of get_act_index_data()."""
+	async def get_act_index_data(self):
+		self.act_index_data = await self._fetch(self._get_act_index_data_url())
+
+		return self.act_index_data
+
+
+	"""Coroutine version of get_act_data()."""
+	async def get_act_data(self, act_id):
+		self.act_data = await self._fetch(self._get_act_data_url(act_id))
+
+		return self.act_data
+
+
+	"""Coroutine version of get_artisan_data()."""
+	async def get_artisan_data(self, artisanSlug):
+		self.artisan_data = await self._fetch(self._get_artisan_data_url(artisanSlug))
+
+		return self.artisan_data
+
+
+	"""Coroutine version of get_recipe_data()."""
+	async def get_recipe_data(self, artisanSlug, recipeSlug):
+		self.recipe_data = await self._fetch(self._get_recipe_data_url(artisanSlug, recipeSlug))
+
+		return self.recipe_data
+
+
+	"""Coroutine version of get_follower_data()."""
+	async def get_follower_data(self, followerSlug):
+		self.follower_data = await self._fetch(self._get_follower_data_url(followerSlug))
+
+		return self.follower_data
+
+
+	"""Coroutine version of get_character_class_data()."""
+	async def get_character_class_data(self, classSlug):
+		self.character_class_data = await self._fetch(self._get_character_class_data_url(classSlug))
+
+		return self.character_class_data
+
+
+	"""Coroutine version of get_skill_data()."""
+	async def get_skill_data(self, classSlug, skillSlug):
+		self.skill_data = await self._fetch(self._get_skill_data_url(classSlug, skillSlug))
+
+		return self.skill_data
+
+
+	"""Coroutine version of get_itemtype_index_data()."""
+	async def get_itemtype_index_data(self):
+		self.itemtype_index_data = await self._fetch(self._get_itemtype_index_data_url())
+
+		return self.itemtype_index_data
+
+
+	"""Coroutine version of get_itemtype_data()."""
+	async def get_itemtype_data(self, itemTypeSlug):
+		self.itemtype_data = await self._fetch(self._get_itemtype_data_url(itemTypeSlug))
+
+		return self.itemtype_data
+
+
+	"""Coroutine version of get_item_data()."""
+	async def get_item_data(self, itemSlugAndId):
+		self.item_data = await self._fetch(self._get_item_data_url(itemSlugAndId))
+
+		return self.item_data
@@ -0,0 +1,343 @@
+##################################################
+# Columnar auction house snapshots.              #
+# AuctionSnapshot: The auctions of a realm at    #
+# one point in time, in NumPy arrays.            #
+# AuctionSnapshotBuilder: Builds snapshots one   #
+# auction at a time.                             #
+# AuctionDiff: Changes between two snapshots.    #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import heapq
+from array import array
+
+import numpy as np
+import pandas as pd
+
+
+# Values of the timeLeft field of auctions, in the order of their codes in AuctionSnapshot.time_left.
+time_left_levels = ["SHORT", "MEDIUM", "LONG", "VERY_LONG"]
+
+# Minimum remaining duration (in seconds) of an auction in each timeLeft level: SHORT is under 30 minutes,
+# MEDIUM 30 minutes to 2 hours, LONG 2 to 12 hours, and VERY_LONG over 12 hours.
+time_left_minimums = np.array([0, 30 * 60, 2 * 3600, 12 * 3600])
+
+
+#
+class AuctionSnapshot:
+
+	"""The auctions of a realm at one point in time, stored column by column: one NumPy array per numeric field,
+	   and categorical codes for the owner, owner realm and time left of each auction. Takes a fraction of the
+	   memory of a list of auction dictionaries, and queries on it are vectorized scans.
+
+	   Auction i is described by self.auc[i], self.item[i], self.owner[i], etc. The arrays must not be modified,
+	   since the indexes of the snapshot are built from them once.
+
+	   PARAMS:
+	   auc, item, bid, buyout, quantity: Array-likes of the fields of the same name of each auction.
+	   owner, owner_realm: Array-likes of the owner and ownerRealm fields of each auction, or pandas Categoricals.
+	   time_left: Array-like of the codes of the timeLeft field of each auction (see time_left_levels).
+	   last_modified: Timestamp of the auction data (in milliseconds)."""
+	def __init__(self, auc, item, owner, owner_realm, bid, buyout, quantity, time_left, last_modified=0):
+		self.auc = np.asarray(auc, dtype=np.int64)
+		self.item = np.asarray(item, dtype=np.int32)
+		self.owner = pd.Categorical(owner)
+		self.owner_realm = pd.Categorical(owner_realm)
+		self.bid = np.asarray(bid, dtype=np.int64)
+		self.buyout = np.asarray(buyout, dtype=np.int64)
+		self.quantity = np.asarray(quantity, dtype=np.int32)
+		self.time_left = np.asarray(time_left, dtype=np.int8)
+		self.last_modified = last_modified
+
+		# Indexes by item id and by owner code, built on first use (see _group_index()).
+		self._item_index = None
+		self._owner_index = None
+
+
+	"""Return the AuctionSnapshot of AUCTIONS, an iterable of auction dictionaries (e.g. WoWAuction.iter_auctions()),
+	   built in a single pass without holding the dictionaries."""
+	@classmethod
+	def from_auctions(cls, auctions, last_modified=0):
+		builder = AuctionSnapshotBuilder()
+
+		for auction in auctions:
+			builder.append(auction)
+
+		return builder.build(last_modified)
+
+
+	def __len__(self):
+		return len(self.auc)
+
+
+	"""Return the dictionary of auction number I, with the keys of the API's auction dictionaries."""
+	def get_auction(self, i):
+		return {'auc': int(self.auc[i]), 'item': int(self.item[i]), 'owner': self.owner[i], 'ownerRealm': self.owner_realm[i],
+			'bid': int(self.bid[i]), 'buyout': int(self.buyout[i]), 'quantity': int(self.quantity[i]),
+			'timeLeft': time_left_levels[self.time_left[i]] if self.time_left[i] >= 0 else None}
+
+
+	"""Return a new AuctionSnapshot of the auctions selected by INDEXES, an array of positions or a boolean mask."""
+	def take(self, indexes):
+		return AuctionSnapshot(self.auc[indexes], self.item[indexes], self.owner[indexes], self.owner_realm[indexes],
+			self.bid[indexes], self.buyout[indexes], self.quantity[indexes], self.time_left[indexes], self.last_modified)
+
+
+	"""Return a pandas DataFrame of the snapshot, with one row per auction and one column per field."""
+	def to_frame(self):
+		return pd.DataFrame({'auc': self.auc, 'item': self.item, 'owner': self.owner, 'ownerRealm': self.owner_realm,
+			'bid': self.bid, 'buyout': self.buyout, 'quantity': self.quantity,
+			'timeLeft': pd.Categorical.from_codes(self.time_left, time_left_levels)})
+
+
+	"""Return the array of the positions of the auctions of ITEM_ID, in O(number of auctions of ITEM_ID)
+	   once the item index of the snapshot is built."""
+	def get_item_positions(self, item_id):
+		if self._item_index is None:
+			self._item_index = _group_index(self.item)
+
+		order, ranges = self._item_index
+		start, end = ranges.get(item_id, (0, 0))
+
+		return order[start:end]
+
+
+	"""Return the array of the positions of the auctions posted by PLAYER_NAME, in O(number of auctions of
+	   PLAYER_NAME) once the owner index of the snapshot is built."""
+	def get_player_positions(self, player_name):
+		if self._owner_index is None:
+			self._owner_index = _group_index(self.owner.codes)
+
+		if player_name not in self.owner.categories:
+			return np.array([], dtype=np.intp)
+
+		order, ranges = self._owner_index
+		start, end = ranges.get(self.owner.categories.get_loc(player_name), (0, 0))
+
+		return order[start:end]
+
+
+	"""Return a dictionary whose keys are the buyout prices of ITEM_ID (in copper, or in gold if IN_GOLD),
+	   and values the total quantity posted for that buyout price, like WoWAuction.get_buyout_prices()."""
+	def get_buyout_prices(self, item_id, in_gold=False):
+		positions = self.get_item_positions(item_id)
+		buyouts = self.buyout[positions]
+
+		if in_gold:
+			buyouts = np.round(buyouts / 10000, 4)
+
+		prices = {}
+
+		for buyout, quantity in zip(buyouts.tolist(), self.quantity[positions].tolist()):
+			prices[buyout] = prices.get(buyout, 0) + quantity
+
+		return prices
+
+
+	"""Return the list of the dictionaries of every auction of ITEM_ID."""
+	def get_auctions_by_item(self, item_id):
+		return [self.get_auction(i) for i in self.get_item_positions(item_id)]
+
+
+	"""Return the list of the dictionaries of the auctions posted by PLAYER_NAME."""
+	def get_auctions_by_player(self, player_name):
+		return [self.get_auction(i) for i in self.get_player_positions(player_name)]
+
+
+	"""Return a dictionary of item id -> array of the positions of the K cheapest auctions of the item, cheapest first,
+	   for every item id of ITEM_IDS. Auctions are compared by unit buyout price (buyout / quantity) if BY is "unit",
+	   or by buyout price if BY is "buyout". Auctions without a buyout price are left out.
+
+	   Each item only costs a partial heap selection over its own auctions (see get_item_positions())."""
+	def get_cheapest_positions(self, item_ids, k=5, by="unit"):
+		if by not in ("unit", "buyout"):
+			raise ValueError("by must be \"unit\" or \"buyout\".")
+			return
+
+		cheapest = {}
+
+		for item_id in item_ids:
+			positions = self.get_item_positions(item_id)
+			positions = positions[self.buyout[positions] > 0]
+			prices = self.buyout[positions] / self.quantity[positions] if by == "unit" else self.buyout[positions]
+
+			cheapest[item_id] = np.array([i for _, i in heapq.nsmallest(k, zip(prices.tolist(), positions.tolist()))], dtype=np.intp)
+
+		return cheapest
+
+
+	"""Return a dictionary of item id -> list of the dictionaries of the K cheapest auctions of the item, cheapest first,
+	   for every item id of ITEM_IDS. See get_cheapest_positions()."""
+	def cheapest(self, item_ids, k=5, by="unit"):
+		return {item_id: [self.get_auction(i) for i in positions]
+			for item_id, positions in self.get_cheapest_positions(item_ids, k, by).items()}
+
+
+	"""Return a pandas DataFrame of market statistics of every item of the snapshot, indexed by item id, computed in
+	   one vectorized pass.
+
+	   Columns: quantity (total quantity listed), auctions (number of auctions), sellers (number of distinct owners),
+	   and the unit_min, unit_mean, unit_median, and unit_pN (for each N in PERCENTILES) of the unit buyout prices of
+	   the item, i.e. buyout / quantity, in copper (or in gold if IN_GOLD). Auctions without a buyout price are left
+	   out of the price statistics, which are NaN for items with no buyout price at all."""
+	def market_summary(self, percentiles=(10, 25, 75, 90), in_gold=False):
+		listings = pd.DataFrame({'item': self.item, 'quantity': self.quantity, 'owner': self.owner.codes})
+		by_item = listings.groupby('item')
+
+		summary = pd.DataFrame({'quantity': by_item['quantity'].sum(), 'auctions': by_item.size(),
+			'sellers': listings.drop_duplicates(['item', 'owner']).groupby('item').size()})
+
+		has_buyout = (self.buyout > 0) & (self.quantity > 0)
+		unit_buyouts = self.buyout[has_buyout] / self.quantity[has_buyout]
+
+		if in_gold:
+			unit_buyouts = unit_buyouts / 10000
+
+		prices = pd.Series(unit_buyouts).groupby(self.item[has_buyout])
+
+		for statistic, values in prices.agg(['min', 'mean', 'median']).items():
+			summary['unit_' + statistic] = values
+
+		if percentiles:
+			fractions = [percentile / 100 for percentile in percentiles]
+			quantiles = prices.quantile(fractions).unstack().reindex(columns=fractions)
+
+			for percentile, fraction in zip(percentiles, fractions):
+				summary['unit_p' + str(percentile)] = quantiles[fraction]
+
+		summary.index.name = 'item'
+
+		return summary
+
+
+	"""Return the AuctionDiff of PREVIOUS, an older AuctionSnapshot of the same realm, and this snapshot."""
+	def diff(self, previous):
+		return AuctionDiff(previous, self)
+
+
+#
+class AuctionDiff:
+
+	"""The differences between two AuctionSnapshots of the same realm, matched on auction ids (auc) with a sorted merge:
+	   auctions added, removed, and changed (bid or timeLeft level) between the two.
+
+	   Removed auctions are split into probable sales and expirations: an auction that was removed although its
+	   timeLeft level in the old snapshot guaranteed it more time than elapsed between the two snapshots (their
+	   last_modified), was bought out (or cancelled); other removed auctions expired (or were bought just before).
+
+	   PARAMS:
+	   old: The older AuctionSnapshot.
+	   new: The newer AuctionSnapshot.
+
+	   Attributes (arrays of positions in OLD or NEW, and boolean masks over them):
+	   added: Positions in NEW of the auctions that are not in OLD.
+	   removed: Positions in OLD of the auctions that are not in NEW.
+	   old_common, new_common: Positions in OLD and in NEW of the auctions in both, in the same order.
+	   bid_changed, time_left_changed: Masks over old_common/new_common of the auctions whose bid, or timeLeft level, changed.
+	   sold: Mask over REMOVED of the probable sales. The other removed auctions probably expired."""
+	def __init__(self, old, new):
+		self.old = old
+		self.new = new
+
+		_, self.old_common, self.new_common = np.intersect1d(old.auc, new.auc, assume_unique=True, return_indices=True)
+		self.added = np.flatnonzero(~np.isin(new.auc, old.auc, assume_unique=True))
+		self.removed = np.flatnonzero(~np.isin(old.auc, new.auc, assume_unique=True))
+
+		self.bid_changed = old.bid[self.old_common] != new.bid[self.new_common]
+		self.time_left_changed = old.time_left[self.old_common] != new.time_left[self.new_common]
+
+		# Seconds between the two snapshots (last_modified is in milliseconds).
+		elapsed = max(0, new.last_modified - old.last_modified) / 1000
+		time_left = old.time_left[self.removed]
+		self.sold = (time_left >= 0) & (time_left_minimums[np.maximum(time_left, 0)] > elapsed)
+
+
+	"""Return the AuctionSnapshot of the auctions added."""
+	def get_added(self):
+		return self.new.take(self.added)
+
+
+	"""Return the AuctionSnapshot of the auctions removed."""
+	def get_removed(self):
+		return self.old.take(self.removed)
+
+
+	"""Return the AuctionSnapshot of the removed auctions that were probably sold."""
+	def get_sold(self):
+		return self.old.take(self.removed[self.sold])
+
+
+	"""Return the AuctionSnapshot of the removed auctions that probably expired."""
+	def get_expired(self):
+		return self.old.take(self.removed[~self.sold])
+
+
+	"""Return a pandas DataFrame of the auctions whose bid or timeLeft level changed, with the columns auc, item,
+	   old_bid, new_bid, old_timeLeft and new_timeLeft."""
+	def get_changed(self):
+		changed = self.bid_changed | self.time_left_changed
+		old_positions = self.old_common[changed]
+		new_positions = self.new_common[changed]
+
+		return pd.DataFrame({'auc': self.old.auc[old_positions], 'item': self.old.item[old_positions],
+			'old_bid': self.old.bid[old_positions], 'new_bid': self.new.bid[new_positions],
+			'old_timeLeft': pd.Categorical.from_codes(self.old.time_left[old_positions], time_left_levels),
+			'new_timeLeft': pd.Categorical.from_codes(self.new.time_left[new_positions], time_left_levels)})
+
+
+	"""Return a dictionary of the number of auctions added, removed, sold, expired, with a changed bid,
+	   and with a changed timeLeft level."""
+	def summary(self):
+		return {'added': len(self.added), 'removed': len(self.removed), 'sold': int(self.sold.sum()),
+			'expired': int((~self.sold).sum()), 'bid_changed': int(self.bid_changed.sum()),
+			'time_left_changed': int(self.time_left_changed.sum())}
+
+
+"""Return an index of KEYS, an array of integer keys (e.g. item ids), as a tuple (order, ranges): ORDER is the
+   array of the positions of KEYS sorted by key, and RANGES a dictionary of key -> (start, end), such that
+   order[start:end] are the positions of that key, in their original order."""
+def _group_index(keys):
+	order = np.argsort(keys, kind='stable')
+	unique_keys, starts = np.unique(keys[order], return_index=True)
+	ends = np.append(starts[1:], len(order))
+
+	return order, dict(zip(unique_keys.tolist(), zip(starts.tolist(), ends.tolist())))
+
+
+#
+class AuctionSnapshotBuilder:
+
+	"""Builds an AuctionSnapshot one auction dictionary at a time, e.g. from auctions parsed as they download,
+	   holding only the columns (in compact arrays) and not the dictionaries."""
+	def __init__(self):
+		self.auc, self.bid, self.buyout = array('q'), array('q'), array('q')
+		self.item, self.quantity = array('i'), array('i')
+		self.time_left = array('b')
+		self.owner, self.owner_realm = array('i'), array('i')
+
+		# Category -> code, for owner and ownerRealm.
+		self.owners = {}
+		self.owner_realms = {}
+
+		self._time_left_codes = {level: code for code, level in enumerate(time_left_levels)}
+
+
+	"""Add AUCTION, an auction dictionary of the API."""
+	def append(self, auction):
+		self.auc.append(auction['auc'])
+		self.item.append(auction['item'])
+		self.bid.append(auction['bid'])
+		self.buyout.append(auction['buyout'])
+		self.quantity.append(auction['quantity'])
+		self.time_left.append(self._time_left_codes.get(auction['timeLeft'], -1))
+		self.owner.append(self.owners.setdefault(auction['owner'], len(self.owners)))
+		self.owner_realm.append(self.owner_realms.setdefault(auction['ownerRealm'], len(self.owner_realms)))
+
+
+	"""Return the AuctionSnapshot of the auctions added, with the timestamp LAST_MODIFIED."""
+	def build(self, last_modified=0):
+		return AuctionSnapshot(self.auc, self.item, pd.Categorical.from_codes(np.asarray(self.owner), list(self.owners)),
+			pd.Categorical.from_codes(np.asarray(self.owner_realm), list(self.owner_realms)), self.bid, self.buyout,
+			self.quantity, self.time_left, last_modified)
@@ -0,0 +1,342 @@
+##################################################
+# Response caches of the BlizzPy transports.     #
+# CacheEntry: A decoded response and its         #
+# validators (ETag/Last-Modified).               #
+# MemoryCache: In-memory LRU cache of entries.   #
+# SQLiteCache: Persistent on-disk cache.         #
+# TTLPolicy: Per-endpoint cache lifetimes.       #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+
+# Lifetimes (in seconds) of cached responses for each endpoint family, as (path regex, seconds) pairs.
+# The first matching regex wins. Static game data almost never changes, so it is cached for days,
+# while player data is cached for minutes. Auction data is never considered fresh (see WoWAuction).
+default_ttl_rules = [(r"^/wow/auction/", 0), (r"^/wow/realm/", 60),
+	(r"^/wow/(character|guild|leaderboard)/", 5 * 60), (r"^/(sc2|d3)/(profile|ladder)/", 5 * 60),
+	(r"^/wow/(item|spell|achievement|quest|recipe|boss|zone|mount|pet)/", 3 * 24 * 3600), (r"^/(sc2|d3)/data/", 3 * 24 * 3600)]
+
+# Limits of the MemoryCache each transport keeps when it isn't given a cache: responses above default_max_entry_bytes
+# (e.g. auction house dumps) are not held in memory, and at most default_max_bytes are held in total.
+default_max_entry_bytes = 2 * 1024 * 1024
+default_max_bytes = 64 * 1024 * 1024
+
+
+#
+class TTLPolicy:
+
+	"""Decides how long a cached response stays fresh, i.e. is returned without asking the API, for each endpoint
+	   family. Once stale, a response is still revalidated with a conditional request if it has validators.
+
+	   PARAMS:
+	   rules: List of (path regex, seconds) pairs, matched against the path of request URLs in order.
+	          If None, use default_ttl_rules.
+	   default: Lifetime (in seconds) of responses of endpoints that match no rule."""
+	def __init__(self, rules=None, default=0):
+		self.rules = [(re.compile(pattern), ttl) for pattern, ttl in (default_ttl_rules if rules is None else rules)]
+		self.default = default
+
+
+	"""Return the lifetime (in seconds) of a response of URL."""
+	def ttl_for(self, url):
+		path = urlsplit(url).path
+
+		for pattern, ttl in self.rules:
+			if pattern.search(path):
+				return ttl
+
+		return self.default
+
+
+"""Return the cache key of URL: the URL with its host lowercased, its query parameters sorted, and its apikey
+   parameter removed, so that the same request made with different API keys shares a cache entry."""
+def cache_key(url):
+	parts = urlsplit(url)
+	query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != "apikey")
+
+	return "{scheme}://{netloc}{path}?{query}".format(
+		scheme = parts.scheme,
+		netloc = parts.netloc.lower(),
+		path = parts.path,
+		query = urlencode(query)
+		)
+
+
+#
+class CacheEntry:
+
+	"""A decoded json response, with the validators the API sent with it.
+
+	   PARAMS:
+	   data: The response body, decoded from json.
+	   etag: Value of the response's ETag header, or None.
+	   last_modified: Value of the response's Last-Modified header, or None.
+	   size: Size of the response body in bytes.
+	   expires_at: Timestamp until which the entry is fresh, or None if it must always be revalidated."""
+	def __init__(self, data, etag=None, last_modified=None, size=0, expires_at=None, stored_at=None):
+		self.data = data
+		self.etag = etag
+		self.last_modified = last_modified
+		self.size = size
+		self.expires_at = expires_at
+		self.stored_at = stored_at if stored_at is not None else time.time()
+
+
+	"""Return True if the entry can be used without asking the API."""
+	def is_fresh(self):
+		return self.expires_at is not None and time.time() < self.expires_at
+
+
+	"""Keep the entry fresh for TTL more seconds (e.g. after a "304 Not Modified")."""
+	def refresh(self, ttl):
+		self.stored_at = time.time()
+		self.expires_at = self.stored_at + ttl if ttl > 0 else None
+
+
+	"""Return the headers that make a request for this entry conditional, i.e. answered with "304 Not Modified"
+	   (and no body) if the entry is still up to date."""
+	def validators(self):
+		headers = {}
+
+		if self.etag is not None:
+			headers["If-None-Match"] = self.etag
+
+		if self.last_modified is not None:
+			headers["If-Modified-Since"] = self.last_modified
+
+		return headers
+
+
+"""Return a CacheEntry of DATA, a response body of SIZE bytes decoded from json, with the validators in HEADERS,
+   fresh for TTL seconds. Return None if the entry would be useless, i.e. if it is never fresh and HEADERS has
+   no validators to revalidate it with."""
+def entry_from_response(data, headers, size=0, ttl=0):
+	etag = headers.get("ETag")
+	last_modified = headers.get("Last-Modified")
+
+	if etag is None and last_modified is None and ttl <= 0:
+		return None
+
+	entry = CacheEntry(data, etag, last_modified, size)
+	entry.refresh(ttl)
+
+	return entry
+
+
+"""Return the lifetime (in seconds) CACHE gives to responses of URL, following its ttl_policy."""
+def cache_ttl(cache, url):
+	ttl_policy = getattr(cache, 'ttl_policy', None)
+
+	return ttl_policy.ttl_for(url) if ttl_policy is not None else 0
+
+
+#
+class MemoryCache:
+
+	"""A thread-safe in-memory cache of CacheEntry objects, which evicts the least recently used entries once it
+	   holds too many entries or too many bytes.
+
+	   PARAMS:
+	   max_entries: Maximum number of entries held.
+	   max_bytes: Maximum total size (in response body bytes) of the entries held, or None for no limit.
+	   max_entry_bytes: Responses bigger than this (in bytes) are not stored, e.g. whole auction house dumps,
+	                    or None for no limit other than max_bytes.
+	   ttl_policy: TTLPolicy of the entries. If None, entries are never fresh and are always revalidated."""
+	def __init__(self, max_entries=256, max_bytes=None, ttl_policy=None, max_entry_bytes=None):
+		self.max_entries = max_entries
+		self.max_bytes = max_bytes
+		self.max_entry_bytes = max_entry_bytes
+		self.ttl_policy = ttl_policy
+
+		self.bytes = 0
+		self.hits = 0
+		self.stale_hits = 0
+		self.misses = 0
+		self.evictions = 0
+
+		self._entries = OrderedDict()
+		self._lock = threading.Lock()
+
+
+	"""Return the entry of KEY, or None if there is none."""
+	def get(self, key):
+		with self._lock:
+			entry = self._entries.get(key)
+
+			if entry is None:
+				self.misses += 1
+
+			else:
+				self._entries.move_to_end(key)
+
+				if entry.is_fresh():
+					self.hits += 1
+
+				else:
+					self.stale_hits += 1
+
+			return entry
+
+
+	"""Store ENTRY under KEY, evicting the least recently used entries if the cache is full. Entries bigger than
+	   self.max_entry_bytes or self.max_bytes are not stored."""
+	def set(self, key, entry):
+		if (self.max_bytes is not None and entry.size > self.max_bytes) or \
+			(self.max_entry_bytes is not None and entry.size > self.max_entry_bytes):
+			self.delete(key)
+			return
+
+		with self._lock:
+			old = self._entries.pop(key, None)
+
+			if old is not None:
+				self.bytes -= old.size
+
+			self._entries[key] = entry
+			self.bytes += entry.size
+
+			while len(self._entries) > self.max_entries or (self.max_bytes is not None and self.bytes > self.max_bytes):
+				_, evicted = self._entries.popitem(last=False)
+				self.bytes -= evicted.size
+				self.evictions += 1
+
+
+	"""Remove the entry of KEY, if any."""
+	def delete(self, key):
+		with self._lock:
+			entry = self._entries.pop(key, None)
+
+			if entry is not None:
+				self.bytes -= entry.size
+
+
+	"""Remove every entry."""
+	def clear(self):
+		with self._lock:
+			self._entries.clear()
+			self.bytes = 0
+
+
+	"""Return a dictionary of the cache's metrics.
+
+	   Keys: entries, bytes, hits (fresh entries returned without a request), stale_hits (entries that had to be
+	   revalidated), misses, evictions."""
+	def stats(self):
+		with self._lock:
+			return {'entries': len(self._entries), 'bytes': self.bytes, 'hits': self.hits, 'stale_hits': self.stale_hits,
+				'misses': self.misses, 'evictions': self.evictions}
+
+
+	def __len__(self):
+		return len(self._entries)
+
+
+# The opt-in process-wide cache shared by every transport that isn't given its own cache.
+_shared_cache = None
+
+
+"""Turn on the process-wide shared cache, and return it: a MemoryCache used by every transport (and so every
+   BlizzPy object) that wasn't given its own cache, so that two objects asking for the same data only fetch it once.
+   If TTL_POLICY is None, use TTLPolicy() (see default_ttl_rules)."""
+def enable_shared_cache(max_entries=1024, max_bytes=256 * 1024 * 1024, ttl_policy=None, max_entry_bytes=default_max_entry_bytes):
+	global _shared_cache
+
+	_shared_cache = MemoryCache(max_entries, max_bytes, ttl_policy if ttl_policy is not None else TTLPolicy(), max_entry_bytes)
+
+	return _shared_cache
+
+
+"""Turn off the process-wide shared cache."""
+def disable_shared_cache():
+	global _shared_cache
+
+	_shared_cache = None
+
+
+"""Return the process-wide shared cache, or None if it is turned off."""
+def get_shared_cache():
+	return _shared_cache
+
+
+#
+class SQLiteCache:
+
+	"""A persistent cache of CacheEntry objects in a SQLite database, which survives restarts and can be shared by
+	   several processes. Entries are stored as json.
+
+	   PARAMS:
+	   path: Path of the SQLite database file.
+	   ttl_policy: TTLPolicy of the entries. If None, use TTLPolicy() (see default_ttl_rules).
+	   max_entry_bytes: Responses bigger than this (in bytes) are not stored, e.g. whole auction house dumps."""
+	def __init__(self, path, ttl_policy=None, max_entry_bytes=32 * 1024 * 1024):
+		self.path = path
+		self.ttl_policy = ttl_policy if ttl_policy is not None else TTLPolicy()
+		self.max_entry_bytes = max_entry_bytes
+
+		self._local = threading.local()
+
+		self._connect().execute("""CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, data TEXT, etag TEXT,
+			last_modified TEXT, size INTEGER, stored_at REAL, expires_at REAL)""")
+
+
+	"""Return the connection of the current thread to the database, opening it on first use."""
+	def _connect(self):
+		conn = getattr(self._local, 'conn', None)
+
+		if conn is None:
+			conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+			conn.execute("PRAGMA journal_mode=WAL")
+			self._local.conn = conn
+
+		return conn
+
+
+	"""Return the entry of KEY, or None if there is none."""
+	def get(self, key):
+		row = self._connect().execute("SELECT data, etag, last_modified, size, stored_at, expires_at FROM entries WHERE key = ?",
+			(key,)).fetchone()
+
+		if row is None:
+			return None
+
+		data, etag, last_modified, size, stored_at, expires_at = row
+
+		return CacheEntry(json.loads(data), etag, last_modified, size, expires_at, stored_at)
+
+
+	"""Store ENTRY under KEY, unless it is bigger than self.max_entry_bytes."""
+	def set(self, key, entry):
+		if entry.size > self.max_entry_bytes:
+			return
+
+		self._connect().execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+			(key, json.dumps(entry.data), entry.etag, entry.last_modified, entry.size, entry.stored_at, entry.expires_at))
+
+
+	"""Remove the entry of KEY, if any."""
+	def delete(self, key):
+		self._connect().execute("DELETE FROM entries WHERE key = ?", (key,))
+
+
+	"""Remove every entry."""
+	def clear(self):
+		self._connect().execute("DELETE FROM entries")
+
+
+	"""Remove every entry that is no longer fresh and has no validators, i.e. that can't be used anymore."""
+	def purge(self):
+		self._connect().execute("DELETE FROM entries WHERE etag IS NULL AND last_modified IS NULL AND expires_at < ?", (time.time(),))
+
+
+	def __len__(self):
+		return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
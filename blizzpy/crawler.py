@@ -0,0 +1,99 @@
+##################################################
+# Crawling the auction house data of many realms #
+# at once.                                       #
+# crawl_auctions: Concurrent downloads, parsing  #
+# in a process pool.                             #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from .auction import AuctionSnapshot
+from .wow import WoWAuction, iter_auction_dump
+
+
+"""Return the market summary of SNAPSHOT (see AuctionSnapshot.market_summary()). The default summary of crawl_auctions()."""
+def summarize_market(snapshot):
+	return snapshot.market_summary()
+
+
+"""Parse the auction data file at PATH into an AuctionSnapshot with the timestamp LAST_MODIFIED, and return
+   SUMMARIZE(snapshot). Runs in the worker processes of crawl_auctions()."""
+def _summarize_dump(path, last_modified, summarize):
+	return summarize(AuctionSnapshot.from_auctions(iter_auction_dump(path), last_modified))
+
+
+"""Download the auction data of every realm of REALMS, with at most MAX_DOWNLOADS downloads at once, and parse and
+   summarize each of them in a pool of MAX_WORKERS processes (the number of CPUs if None), so that json decoding runs
+   on every core while the next downloads go on. Downloads only run ahead of parsing by about MAX_WORKERS auction
+   data files, so that at most MAX_DOWNLOADS + MAX_WORKERS files are on disk at once.
+
+   SUMMARIZE is called in the worker processes on the AuctionSnapshot of each realm, and its return value is sent back.
+   It must be picklable, i.e. a function defined at the top level of a module. The default is summarize_market().
+   The auction data files are downloaded to a temporary directory and each is deleted as soon as its realm is
+   summarized, unless DUMP_DIR is given, in which case they are kept in DUMP_DIR as <realm>.json.
+
+   Yields (realm, summary, error) tuples in the order the summaries complete, where ERROR is None, or the exception
+   raised while downloading or summarizing the auction data of the realm.
+
+   Since it starts processes, call it under if __name__ == "__main__": in scripts."""
+def crawl_auctions(api_key, realms, summarize=summarize_market, locale="en_US", max_downloads=8, max_workers=None,
+	dump_dir=None, token=None, transport=None):
+	directory = dump_dir if dump_dir is not None else tempfile.mkdtemp(prefix="blizzpy-auctions-")
+	max_parsing = max_workers if max_workers is not None else (os.cpu_count() or 1)
+	realms = iter(realms)
+
+	def download(realm, path):
+		return WoWAuction(api_key, realm, locale, token, transport).download_auction_data(path)
+
+	try:
+		with ThreadPoolExecutor(max_workers=max_downloads) as downloads, ProcessPoolExecutor(max_workers=max_workers) as workers:
+			# Future -> (realm, path of its auction data file, True if it is a download or False if it is a summary).
+			pending = {}
+			downloading = 0
+
+			while True:
+				# Start the next downloads, unless enough files already wait for a worker process.
+				while downloading < max_downloads and len(pending) < max_downloads + max_parsing:
+					realm = next(realms, None)
+
+					if realm is None:
+						break
+
+					path = os.path.join(directory, realm + ".json")
+					pending[downloads.submit(download, realm, path)] = (realm, path, True)
+					downloading += 1
+
+				if not pending:
+					break
+
+				done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+				for future in done:
+					realm, path, is_download = pending.pop(future)
+					error = future.exception()
+
+					if is_download:
+						downloading -= 1
+
+					if is_download and error is None:
+						pending[workers.submit(_summarize_dump, path, future.result(), summarize)] = (realm, path, False)
+						continue
+
+					if dump_dir is None and os.path.exists(path):
+						os.remove(path)
+
+					if error is None:
+						yield realm, future.result(), None
+
+					else:
+						yield realm, None, error
+
+	finally:
+		if dump_dir is None:
+			shutil.rmtree(directory, ignore_errors=True)
@@ -7,7 +7,7 @@
 # Written by Lewis Kim.                  #
 ##########################################
 
-import urllib, json
+from .transport import get_default_transport, BlizzardAPIError
 
 # Accepted API locales. zh_TW has been excluded for now due to continuous "503 Service Unavailable" errors from the Blizzard API.
 # To add: zh_TW
@@ -18,7 +18,7 @@ accepted_locales = ["en_US", "en_GB", "ko_KR"]
 class D3Profile:
 
 	"""."""
-	def __init__(self, api_key, battle_tag, locale="en_US", token=None):
+	def __init__(self, api_key, battle_tag, locale="en_US", token=None, transport=None):
 		# Check if the user-given locale is supported, i.e. is one of Blizzard's regions.
 		if locale not in accepted_locales:
 			raise ValueError("Not supported locale.")
@@ -37,6 +37,7 @@ class D3Profile:
 		# 	self.root = "https://tw.api.battle.net"
 
 		self.api_key = api_key
+		self.transport = transport if transport is not None else get_default_transport()
 
 		self.battle_tag = battle_tag
 
@@ -112,11 +113,13 @@ class D3Profile:
 	"""."""
 	def get_profile_data(self):
 		try:
-			with urllib.request.urlopen(self._get_profile_data_url()) as url:
-				self.profile_data = json.loads(url.read().decode())
+			self.profile_data = self.transport.get_json(self._get_profile_data_url())
 
 			return self.profile_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -127,11 +130,13 @@ class D3Profile:
 	"""."""
 	def get_hero_data(self, hero_id):
 		try:
-			with urllib.request.urlopen(self._get_hero_data_url(hero_id)) as url:
-				self.hero_data = json.loads(url.read().decode())
+			self.hero_data = self.transport.get_json(self._get_hero_data_url(hero_id))
 
 			return self.hero_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -142,11 +147,13 @@ class D3Profile:
 	"""."""
 	def get_hero_items_data(self, hero_id):
 		try:
-			with urllib.request.urlopen(self._get_hero_items_data_url(hero_id)) as url:
-				self.hero_items_data = json.loads(url.read().decode())
+			self.hero_items_data = self.transport.get_json(self._get_hero_items_data_url(hero_id))
 
 			return self.hero_items_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -155,11 +162,13 @@ class D3Profile:
 	"""."""
 	def get_follower_items_data(self, hero_id):
 		try:
-			with urllib.request.urlopen(self._get_follower_items_data_url(hero_id)) as url:
-				self.follower_items_data = json.loads(url.read().decode())
+			self.follower_items_data = self.transport.get_json(self._get_follower_items_data_url(hero_id))
 
 			return self.follower_items_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -169,7 +178,7 @@ class D3Profile:
 class D3General:
 
 	"""."""
-	def __init__(self, api_key, locale="en_US", token=None):
+	def __init__(self, api_key, locale="en_US", token=None, transport=None):
 		# Check if the user-given locale is supported, i.e. is one of Blizzard's regions.
 		if locale not in accepted_locales:
 			raise ValueError("Not supported locale.")
@@ -188,6 +197,7 @@ class D3General:
 		# 	self.root = "https://tw.api.battle.net"
 
 		self.api_key = api_key
+		self.transport = transport if transport is not None else get_default_transport()
 
 		self.locale = locale
 
@@ -340,11 +350,13 @@ class D3General:
 	"""."""
 	def get_act_index_data(self):
 		try:
-			with urllib.request.urlopen(self._get_act_index_data_url()) as url:
-				self.act_index_data = json.loads(url.read().decode())
+			self.act_index_data = self.transport.get_json(self._get_act_index_data_url())
 
 			return self.act_index_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -353,11 +365,13 @@ class D3General:
 	"""."""
 	def get_act_data(self, act_id):
 		try:
-			with urllib.request.urlopen(self._get_act_data_url(act_id)) as url:
-				self.act_data = json.loads(url.read().decode())
+			self.act_data = self.transport.get_json(self._get_act_data_url(act_id))
 
 			return self.act_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -368,11 +382,13 @@ class D3General:
 	"""."""
 	def get_artisan_data(self, artisanSlug):
 		try:
-			with urllib.request.urlopen(self._get_artisan_data_url(artisanSlug)) as url:
-				self.artisan_data = json.loads(url.read().decode())
+			self.artisan_data = self.transport.get_json(self._get_artisan_data_url(artisanSlug))
 
 			return self.artisan_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -381,11 +397,13 @@ class D3General:
 	"""."""
 	def get_recipe_data(self, artisanSlug, recipeSlug):
 		try:
-			with urllib.request.urlopen(self._get_recipe_data_url(artisanSlug, recipeSlug)) as url:
-				self.recipe_data = json.loads(url.read().decode())
+			self.recipe_data = self.transport.get_json(self._get_recipe_data_url(artisanSlug, recipeSlug))
 
 			return self.recipe_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -396,11 +414,13 @@ class D3General:
 	"""."""
 	def get_follower_data(self, followerSlug):
 		try:
-			with urllib.request.urlopen(self._get_follower_data_url(followerSlug)) as url:
-				self.follower_data = json.loads(url.read().decode())
+			self.follower_data = self.transport.get_json(self._get_follower_data_url(followerSlug))
 
 			return self.follower_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -411,11 +431,13 @@ class D3General:
 	"""."""
 	def get_character_class_data(self, classSlug):
 		try:
-			with urllib.request.urlopen(self._get_character_class_data_url(classSlug)) as url:
-				self.character_class_data = json.loads(url.read().decode())
+			self.character_class_data = self.transport.get_json(self._get_character_class_data_url(classSlug))
 
 			return self.character_class_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -424,11 +446,13 @@ class D3General:
 	"""."""
 	def get_skill_data(self, classSlug, skillSlug):
 		try:
-			with urllib.request.urlopen(self._get_skill_data_url(classSlug, skillSlug)) as url:
-				self.skill_data = json.loads(url.read().decode())
+			self.skill_data = self.transport.get_json(self._get_skill_data_url(classSlug, skillSlug))
 
 			return self.skill_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -439,11 +463,13 @@ class D3General:
 	"""."""
 	def get_itemtype_index_data(self):
 		try:
-			with urllib.request.urlopen(self._get_itemtype_index_data_url()) as url:
-				self.itemtype_index_data = json.loads(url.read().decode())
+			self.itemtype_index_data = self.transport.get_json(self._get_itemtype_index_data_url())
 
 			return self.itemtype_index_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -452,11 +478,13 @@ class D3General:
 	"""."""
 	def get_itemtype_data(self, itemTypeSlug):
 		try:
-			with urllib.request.urlopen(self._get_itemtype_data_url(itemTypeSlug)) as url:
-				self.itemtype_data = json.loads(url.read().decode())
+			self.itemtype_data = self.transport.get_json(self._get_itemtype_data_url(itemTypeSlug))
 
 			return self.itemtype_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -465,11 +493,13 @@ class D3General:
 	"""."""
 	def get_item_data(self, itemSlugAndId):
 		try:
-			with urllib.request.urlopen(self._get_item_data_url(itemSlugAndId)) as url:
-				self.item_data = json.loads(url.read().decode())
+			self.item_data = self.transport.get_json(self._get_item_data_url(itemSlugAndId))
 
 			return self.item_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
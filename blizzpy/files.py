@@ -0,0 +1,36 @@
+##################################################
+# File helpers shared by BlizzPy modules.        #
+# atomic_write: Write a file so that readers     #
+# never see it partially written.                #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+"""Context manager that opens a temporary file in the directory of PATH with MODE (and ENCODING), yields it for
+   writing, and replaces the file at PATH with it once the block completes, e.g.
+
+   with atomic_write(path, 'w', encoding='utf-8') as f:
+       json.dump(data, f)
+
+   If the block raises (or the task running it is cancelled), the temporary file is removed and PATH is left as it was,
+   so a failed or interrupted write never leaves a truncated file at PATH."""
+@contextmanager
+def atomic_write(path, mode='wb', encoding=None):
+	_, extension = os.path.splitext(path)
+	fd, temp_path = tempfile.mkstemp(suffix=extension, dir=os.path.dirname(os.path.abspath(path)))
+
+	try:
+		with os.fdopen(fd, mode, encoding=encoding) as f:
+			yield f
+
+		os.replace(temp_path, path)
+
+	except:
+		os.remove(temp_path)
+		raise
@@ -0,0 +1,187 @@
+##################################################
+# Local time-series store of auction snapshots.  #
+# AuctionHistoryStore: Append-only compressed    #
+# columnar chunks, read back memory-mapped.      #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from .auction import AuctionSnapshot
+from .files import atomic_write
+
+
+# Columns of the chunks of AuctionHistoryStore. Owners and owner realms are stored as codes and categories.
+history_columns = ['auc', 'item', 'bid', 'buyout', 'quantity', 'time_left', 'owner_codes', 'owner_categories',
+	'owner_realm_codes', 'owner_realm_categories']
+
+
+#
+class AuctionHistoryStore:
+
+	"""An append-only store of AuctionSnapshots on disk, e.g. for the price history of items over weeks.
+
+	   Each snapshot is a chunk of compressed columns (a .npz file) at PATH/<realm>/<lastModified>.npz, with its auctions
+	   sorted by item id. By default, the columns a query uses are decompressed in memory every time the chunk is read.
+
+	   Compressed files can't be memory-mapped. If EXPAND, the first time a chunk is read, its columns are expanded to
+	   uncompressed .npy files next to it (PATH/<realm>/<lastModified>.d/), which are then memory-mapped: repeated
+	   queries only read the pages of the auctions they use, but every chunk read is then stored twice, once
+	   uncompressed, until clear_expanded() removes the expanded copies.
+
+	   PARAMS:
+	   path: Directory of the store. Created if missing.
+	   expand: If True, expand chunks to memory-mapped .npy files when they are read. If False, decompress the columns
+	           of a chunk in memory every time it is read, and keep no uncompressed files on disk."""
+	def __init__(self, path, expand=False):
+		self.path = path
+		self.expand = expand
+
+		os.makedirs(self.path, exist_ok=True)
+
+
+	"""Return the path of the chunk of REALM at LAST_MODIFIED."""
+	def _chunk_path(self, realm, last_modified):
+		return os.path.join(self.path, realm, str(int(last_modified)) + ".npz")
+
+
+	"""Add SNAPSHOT, an AuctionSnapshot of REALM, to the store, and return True. The snapshot is stored under its
+	   last_modified timestamp; if a snapshot of REALM with that timestamp is already stored, return False instead.
+	   Can be used as the callback of an AuctionPoller."""
+	def append(self, realm, snapshot):
+		path = self._chunk_path(realm, snapshot.last_modified)
+
+		if os.path.exists(path):
+			return False
+
+		os.makedirs(os.path.dirname(path), exist_ok=True)
+
+		order = np.argsort(snapshot.item, kind='stable')
+
+		# Written atomically, so that readers never see a partial chunk.
+		with atomic_write(path) as f:
+			np.savez_compressed(f, auc=snapshot.auc[order], item=snapshot.item[order], bid=snapshot.bid[order],
+				buyout=snapshot.buyout[order], quantity=snapshot.quantity[order], time_left=snapshot.time_left[order],
+				owner_codes=snapshot.owner.codes[order], owner_categories=np.array(snapshot.owner.categories, dtype=str),
+				owner_realm_codes=snapshot.owner_realm.codes[order],
+				owner_realm_categories=np.array(snapshot.owner_realm.categories, dtype=str))
+
+		return True
+
+
+	"""Return the sorted list of the realms in the store."""
+	def get_realms(self):
+		return sorted(name for name in os.listdir(self.path) if os.path.isdir(os.path.join(self.path, name)))
+
+
+	"""Return the sorted list of the lastModified timestamps of the snapshots of REALM in the store, between START
+	   and END (inclusive, in milliseconds) if they are not None."""
+	def get_timestamps(self, realm, start=None, end=None):
+		directory = os.path.join(self.path, realm)
+
+		if not os.path.isdir(directory):
+			return []
+
+		timestamps = sorted(int(name[:-4]) for name in os.listdir(directory) if name.endswith(".npz") and name[:-4].isdigit())
+
+		return [timestamp for timestamp in timestamps if (start is None or timestamp >= start) and (end is None or timestamp <= end)]
+
+
+	"""Return the path of the expanded copy of the chunk of REALM at LAST_MODIFIED (see _read_columns())."""
+	def _expanded_path(self, realm, last_modified):
+		return self._chunk_path(realm, last_modified)[:-4] + ".d"
+
+
+	"""Remove the expanded copies of the chunks of REALM, or of every realm if REALM is None, e.g. once a batch of
+	   history queries is over, and return the number of copies removed. The chunks themselves are kept."""
+	def clear_expanded(self, realm=None):
+		removed = 0
+
+		for name in (self.get_realms() if realm is None else [realm]):
+			for last_modified in self.get_timestamps(name):
+				directory = self._expanded_path(name, last_modified)
+
+				if os.path.isdir(directory):
+					shutil.rmtree(directory)
+					removed += 1
+
+		return removed
+
+
+	"""Return a dictionary of column name -> array of the chunk of REALM at LAST_MODIFIED, memory-mapped if self.expand."""
+	def _read_columns(self, realm, last_modified):
+		path = self._chunk_path(realm, last_modified)
+
+		if not self.expand:
+			with np.load(path) as chunk:
+				return {name: chunk[name] for name in history_columns}
+
+		directory = self._expanded_path(realm, last_modified)
+
+		if not os.path.isdir(directory):
+			temp_directory = tempfile.mkdtemp(dir=os.path.dirname(path))
+
+			with np.load(path) as chunk:
+				for name in history_columns:
+					np.save(os.path.join(temp_directory, name + ".npy"), chunk[name])
+
+			try:
+				os.rename(temp_directory, directory)
+
+			# Another reader expanded the chunk first.
+			except OSError:
+				shutil.rmtree(temp_directory)
+
+		return {name: np.load(os.path.join(directory, name + ".npy"), mmap_mode='r') for name in history_columns}
+
+
+	"""Return the AuctionSnapshot of REALM at LAST_MODIFIED, with its auctions sorted by item id. Its numeric columns are
+	   memory-mapped if self.expand."""
+	def load(self, realm, last_modified):
+		columns = self._read_columns(realm, last_modified)
+
+		return AuctionSnapshot(columns['auc'], columns['item'],
+			pd.Categorical.from_codes(columns['owner_codes'], columns['owner_categories']),
+			pd.Categorical.from_codes(columns['owner_realm_codes'], columns['owner_realm_categories']),
+			columns['bid'], columns['buyout'], columns['quantity'], columns['time_left'], last_modified)
+
+
+	"""Return a pandas DataFrame of the price history of ITEM_ID on REALM, with one row per stored snapshot between
+	   START and END (inclusive, in milliseconds) if they are not None, indexed by the time of the snapshot.
+
+	   Columns: quantity (total quantity listed), auctions (number of auctions), and unit_min and unit_median, the
+	   minimum and median unit buyout prices (buyout / quantity) of the item, in copper (or in gold if IN_GOLD).
+	   Only the auctions of ITEM_ID are read from each snapshot, located by binary search on the sorted item ids."""
+	def get_price_history(self, item_id, realm, start=None, end=None, in_gold=False):
+		timestamps = self.get_timestamps(realm, start, end)
+		rows = []
+
+		for timestamp in timestamps:
+			columns = self._read_columns(realm, timestamp)
+			first, last = np.searchsorted(columns['item'], [item_id, item_id + 1])
+
+			buyout = np.asarray(columns['buyout'][first:last])
+			quantity = np.asarray(columns['quantity'][first:last])
+
+			has_buyout = (buyout > 0) & (quantity > 0)
+			unit_buyouts = buyout[has_buyout] / quantity[has_buyout]
+
+			if in_gold:
+				unit_buyouts = unit_buyouts / 10000
+
+			rows.append({'quantity': int(quantity.sum()), 'auctions': int(last - first),
+				'unit_min': unit_buyouts.min() if len(unit_buyouts) else np.nan,
+				'unit_median': np.median(unit_buyouts) if len(unit_buyouts) else np.nan})
+
+		history = pd.DataFrame(rows, columns=['quantity', 'auctions', 'unit_min', 'unit_median'],
+			index=pd.to_datetime(timestamps, unit='ms'))
+		history.index.name = 'time'
+
+		return history
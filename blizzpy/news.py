@@ -0,0 +1,79 @@
+##################################################
+# Incremental reading of guild news feeds.       #
+# NewsCursor: The last news entry seen of each   #
+# guild, to only return newer entries.           #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import json
+import threading
+
+from .files import atomic_write
+
+
+"""Return the key of the guild GUILD_NAME of REALM in a NewsCursor."""
+def guild_key(guild_name, realm):
+	return realm.lower() + "/" + guild_name.lower()
+
+
+"""Return a string identifying the news entry ENTRY, to tell apart entries with the same timestamp."""
+def _entry_id(entry):
+	return json.dumps(entry, sort_keys=True)
+
+
+#
+class NewsCursor:
+
+	"""Keeps a high-water mark of the news feed of each guild: the timestamp of the newest entry seen, and the entries
+	   seen with that timestamp (news entries often share a timestamp, e.g. loot from the same boss), so that only
+	   newer entries are returned by new_entries(). Thread-safe, so one cursor can be shared by many guilds.
+
+	   PARAMS:
+	   path: Path of a json file to keep the high-water marks in between runs, or None. They are loaded from the file
+	         if it exists, and written to it by save()."""
+	def __init__(self, path=None):
+		self.path = path
+
+		# Guild key -> {'timestamp': timestamp of the newest entry seen, 'seen': ids of the entries seen with that timestamp}.
+		self.marks = {}
+		self._lock = threading.Lock()
+
+		if self.path is not None:
+			try:
+				with open(self.path, encoding='utf-8') as f:
+					self.marks = json.load(f)
+
+			except FileNotFoundError:
+				pass
+
+
+	"""Return the list of the entries of NEWS, the news feed of the guild KEY (see guild_key()), that are newer than
+	   the ones seen in previous calls, oldest first, and mark them as seen."""
+	def new_entries(self, key, news):
+		with self._lock:
+			mark = self.marks.get(key, {'timestamp': None, 'seen': []})
+			timestamp = mark['timestamp']
+			seen = set(mark['seen'])
+
+			entries = [entry for entry in news if timestamp is None or entry['timestamp'] > timestamp
+				or (entry['timestamp'] == timestamp and _entry_id(entry) not in seen)]
+			entries.sort(key=lambda entry: entry['timestamp'])
+
+			if entries:
+				newest = entries[-1]['timestamp']
+
+				if newest != timestamp:
+					seen = set()
+
+				seen.update(_entry_id(entry) for entry in entries if entry['timestamp'] == newest)
+				self.marks[key] = {'timestamp': newest, 'seen': sorted(seen)}
+
+			return entries
+
+
+	"""Write the high-water marks to the json file at self.path, replacing it at once."""
+	def save(self):
+		with self._lock, atomic_write(self.path, 'w', encoding='utf-8') as f:
+			json.dump(self.marks, f)
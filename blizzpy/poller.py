@@ -0,0 +1,185 @@
+##################################################
+# Long-running pollers of the Blizzard API.      #
+# Poller: Polls many targets on one schedule.    #
+# AuctionPoller: Downloads the auction data of   #
+# many realms only when it changes.              #
+# GuildNewsPoller: New news of many guilds.      #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import threading
+import time
+
+from .news import NewsCursor
+from .wow import WoWAuction, WoWGuild
+from .workers import imap_bounded
+
+
+#
+class Poller:
+
+	"""Base class of the pollers. Every INTERVAL seconds, polls each of TARGETS with poll_target() (implemented by
+	   subclasses) in a pool of MAX_CONCURRENCY threads, and emits every result that isn't None to CALLBACK and QUEUE.
+
+	   PARAMS:
+	   targets: List of the targets to poll, e.g. realm names.
+	   callback: Function called as callback(target, result) with each result, or None.
+	   queue: Queue (e.g. a queue.Queue) each (target, result) tuple is put into, or None.
+	   error_callback: Function called as error_callback(target, error) when polling a target raises an exception,
+	                   or None. The last error of each target is also kept in self.errors.
+	   interval: Number of seconds between the starts of two polls.
+	   max_concurrency: Maximum number of targets polled at once."""
+	def __init__(self, targets, callback=None, queue=None, error_callback=None, interval=300, max_concurrency=8):
+		self.targets = list(targets)
+		self.callback = callback
+		self.queue = queue
+		self.error_callback = error_callback
+		self.interval = interval
+		self.max_concurrency = max_concurrency
+
+		self.errors = {}
+
+		self._stop = threading.Event()
+		self._thread = None
+
+
+	"""Poll TARGET, and return the result to emit, or None if there is nothing new. Implemented by subclasses."""
+	def poll_target(self, target):
+		raise NotImplementedError
+
+
+	"""Emit RESULT of TARGET to self.callback and self.queue."""
+	def emit(self, target, result):
+		if self.callback is not None:
+			self.callback(target, result)
+
+		if self.queue is not None:
+			self.queue.put((target, result))
+
+
+	"""Poll every target once, emitting each new result, and return the list of the targets that had one."""
+	def poll(self):
+		updated = []
+
+		for target, result, error in imap_bounded(self.poll_target, self.targets, self.max_concurrency):
+			if error is not None:
+				self.errors[target] = error
+
+				if self.error_callback is not None:
+					self.error_callback(target, error)
+
+			elif result is not None:
+				self.errors.pop(target, None)
+				self.emit(target, result)
+				updated.append(target)
+
+			else:
+				self.errors.pop(target, None)
+
+		return updated
+
+
+	"""Poll every target every self.interval seconds until stop() is called, or MAX_POLLS polls if it isn't None."""
+	def run(self, max_polls=None):
+		polls = 0
+
+		while not self._stop.is_set() and (max_polls is None or polls < max_polls):
+			started = time.monotonic()
+
+			self.poll()
+			polls += 1
+
+			if max_polls is None or polls < max_polls:
+				self._stop.wait(max(0, self.interval - (time.monotonic() - started)))
+
+
+	"""Start run() in a background thread."""
+	def start(self):
+		self._stop.clear()
+		self._thread = threading.Thread(target=self.run, daemon=True)
+		self._thread.start()
+
+
+	"""Stop run(), and wait for the background thread started by start() to finish its current poll."""
+	def stop(self):
+		self._stop.set()
+
+		if self._thread is not None:
+			self._thread.join()
+			self._thread = None
+
+
+#
+class AuctionPoller(Poller):
+
+	"""Polls the auction data of many realms. Each poll only checks the small metadata of the auction data of each
+	   realm (its lastModified timestamp, revalidated with a conditional request), and downloads and parses the
+	   auction data into an AuctionSnapshot only when the timestamp advanced since the last download.
+
+	   Results are (realm, snapshot) pairs, emitted to CALLBACK and QUEUE. See Poller for the other parameters.
+
+	   PARAMS:
+	   api_key: API key of the requests.
+	   realms: List of the names of the realms to poll.
+	   locale: Locale of the realms. See WoWAuction."""
+	def __init__(self, api_key, realms, callback=None, queue=None, error_callback=None, interval=300, locale="en_US",
+		max_concurrency=8, token=None, transport=None):
+		super().__init__(realms, callback, queue, error_callback, interval, max_concurrency)
+
+		self.auctions = {realm: WoWAuction(api_key, realm, locale, token, transport) for realm in self.targets}
+
+		# Realm -> lastModified timestamp of its last downloaded auction data.
+		self.last_modified = {realm: 0 for realm in self.targets}
+
+
+	"""Return the new AuctionSnapshot of REALM, or None if its auction data did not change since the last download."""
+	def poll_target(self, realm):
+		auction = self.auctions[realm]
+
+		if auction.check_last_modified() <= self.last_modified[realm]:
+			return None
+
+		snapshot = auction.get_snapshot()
+		self.last_modified[realm] = snapshot.last_modified
+
+		return snapshot
+
+
+#
+class GuildNewsPoller(Poller):
+
+	"""Polls the news feeds of many guilds, and emits only the entries that are newer than the ones already emitted,
+	   tracked per guild with a NewsCursor (high-water marks of the timestamps of the entries).
+
+	   Results are (guild, entries) pairs, where GUILD is a (guild name, realm) pair of GUILDS and ENTRIES the list of
+	   its new entries, oldest first. See Poller for the other parameters.
+
+	   PARAMS:
+	   api_key: API key of the requests.
+	   guilds: List of the (guild name, realm) pairs of the guilds to poll.
+	   cursor: NewsCursor of the guilds, e.g. NewsCursor("news.json") to only emit new entries across restarts.
+	           If it has a path, it is saved after every poll. If None, use a new NewsCursor().
+	   locale: Locale of the guilds. See WoWGuild."""
+	def __init__(self, api_key, guilds, callback=None, queue=None, error_callback=None, interval=300, cursor=None,
+		locale="en_US", max_concurrency=8, token=None, transport=None):
+		super().__init__([tuple(guild) for guild in guilds], callback, queue, error_callback, interval, max_concurrency)
+
+		self.cursor = cursor if cursor is not None else NewsCursor()
+		self.guilds = {guild: WoWGuild(api_key, guild[0], guild[1], locale, token, transport) for guild in self.targets}
+
+
+	"""Return the list of the new news entries of GUILD, or None if there are none."""
+	def poll_target(self, guild):
+		return self.guilds[guild].get_new_guild_news(self.cursor) or None
+
+
+	"""Poll every guild once (see Poller.poll()), then save the cursor if it has a path."""
+	def poll(self):
+		updated = super().poll()
+
+		if self.cursor.path is not None:
+			self.cursor.save()
+
+		return updated
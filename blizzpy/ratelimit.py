@@ -0,0 +1,150 @@
+##################################################
+# Rate limiting for the Blizzard API quotas.     #
+# RateLimiter: Token buckets shared by every     #
+# request of a process (or of many processes).   #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import sqlite3
+import threading
+import time
+
+
+# Blizzard API quotas of a single API key: 100 requests per second, and 36,000 requests per hour.
+default_per_second = 100
+default_per_hour = 36000
+
+
+#
+class RateLimiter:
+
+	"""A token-bucket rate limiter for the Blizzard API quotas. Every request takes one token from each bucket;
+	   a request that finds a bucket empty waits until the bucket refills, so requests run at exactly the quota
+	   ceiling and never over it.
+
+	   PARAMS:
+	   per_second: Maximum number of requests per second, or None for no per-second limit.
+	   per_hour: Maximum number of requests per hour, or None for no per-hour limit.
+	   path: Path of a SQLite database that holds the buckets, to share them between processes.
+	         If None, the buckets are only shared by the threads of this process."""
+	def __init__(self, per_second=default_per_second, per_hour=default_per_hour, path=None):
+		# Bucket name -> (capacity, tokens refilled per second).
+		self.buckets = {}
+
+		if per_second:
+			self.buckets['second'] = (per_second, float(per_second))
+
+		if per_hour:
+			self.buckets['hour'] = (per_hour, per_hour / 3600.0)
+
+		self.path = path
+
+		# Bucket name -> [tokens, timestamp of the last refill], when not shared through PATH.
+		self._state = {name: [capacity, time.time()] for name, (capacity, rate) in self.buckets.items()}
+		self._lock = threading.Lock()
+
+		self.acquired = 0
+		self.throttled = 0
+		self.throttled_seconds = 0.0
+
+		if self.path is not None:
+			with self._connect() as conn:
+				conn.execute("CREATE TABLE IF NOT EXISTS buckets (name TEXT PRIMARY KEY, tokens REAL, updated REAL)")
+
+
+	"""Return a new connection to the SQLite database at self.path."""
+	def _connect(self):
+		return sqlite3.connect(self.path, timeout=60, isolation_level=None)
+
+
+	"""Take one token from every bucket in STATE (bucket name -> [tokens, updated]) at time NOW, and return the
+	   number of seconds to wait until the token is actually available. Buckets may go below zero, which
+	   reserves tokens that are refilled in the future for the callers that are already waiting."""
+	def _take(self, state, now):
+		wait = 0.0
+
+		for name, (capacity, rate) in self.buckets.items():
+			tokens, updated = state.get(name, (capacity, now))
+			tokens = min(capacity, tokens + (now - updated) * rate) - 1
+
+			if tokens < 0:
+				wait = max(wait, -tokens / rate)
+
+			state[name] = [tokens, now]
+
+		return wait
+
+
+	"""Reserve a request, and return the number of seconds the caller must wait before sending it."""
+	def reserve(self):
+		if self.path is None:
+			with self._lock:
+				wait = self._take(self._state, time.time())
+
+		else:
+			conn = self._connect()
+
+			try:
+				# BEGIN IMMEDIATE locks the database, so the buckets are read and written by one process at a time.
+				conn.execute("BEGIN IMMEDIATE")
+				state = {name: [tokens, updated] for name, tokens, updated in conn.execute("SELECT name, tokens, updated FROM buckets")}
+				wait = self._take(state, time.time())
+				conn.executemany("INSERT OR REPLACE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)",
+					[(name, tokens, updated) for name, (tokens, updated) in state.items()])
+				conn.execute("COMMIT")
+
+			finally:
+				conn.close()
+
+		with self._lock:
+			self.acquired += 1
+
+			if wait > 0:
+				self.throttled += 1
+				self.throttled_seconds += wait
+
+		return wait
+
+
+	"""Block until a request may be sent under the quotas."""
+	def acquire(self):
+		wait = self.reserve()
+
+		if wait > 0:
+			time.sleep(wait)
+
+
+	"""Return a dictionary of the limiter's metrics.
+
+	   Keys: acquired (number of requests), throttled (number of requests that had to wait),
+	   throttled_seconds (total time spent waiting)."""
+	def stats(self):
+		with self._lock:
+			return {'acquired': self.acquired, 'throttled': self.throttled, 'throttled_seconds': self.throttled_seconds}
+
+
+# The process-wide rate limiter used by every transport that isn't given its own.
+_default_rate_limiter = None
+_default_rate_limiter_lock = threading.Lock()
+
+
+"""Return the process-wide default RateLimiter, creating it on first use."""
+def get_default_rate_limiter():
+	global _default_rate_limiter
+
+	with _default_rate_limiter_lock:
+		if _default_rate_limiter is None:
+			_default_rate_limiter = RateLimiter()
+
+		return _default_rate_limiter
+
+
+"""Replace the process-wide default RateLimiter with RATE_LIMITER, e.g. to share it between processes with
+   RateLimiter(path="blizzpy_quota.db")."""
+def set_default_rate_limiter(rate_limiter):
+	global _default_rate_limiter
+
+	with _default_rate_limiter_lock:
+		_default_rate_limiter = rate_limiter
@@ -0,0 +1,120 @@
+##################################################
+# Retries and circuit breaking for transient     #
+# Blizzard API failures.                         #
+# RetryPolicy: Exponential backoff with jitter.  #
+# CircuitBreaker: Fail fast while a region is    #
+# down.                                          #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import random
+import threading
+import time
+
+
+#
+class RetryPolicy:
+
+	"""How transports retry requests that failed with a transient error (a timeout, a dropped connection,
+	   "429 Too Many Requests", or a 5xx status).
+
+	   PARAMS:
+	   max_retries: Maximum number of retries of a request, after its first attempt.
+	   backoff: Base delay (in seconds) of the first retry. Doubles with every retry.
+	   max_backoff: Maximum delay (in seconds) between two attempts, unless the API asks for longer with Retry-After.
+	   jitter: If True, wait a random delay between 0 and the exponential delay ("full jitter"), so that
+	           many clients failing at once do not retry at once."""
+	def __init__(self, max_retries=3, backoff=0.5, max_backoff=30, jitter=True):
+		self.max_retries = max_retries
+		self.backoff = backoff
+		self.max_backoff = max_backoff
+		self.jitter = jitter
+
+
+	"""Return the number of seconds to wait before retry number ATTEMPT (starting from 0).
+	   If the API sent a Retry-After header, RETRY_AFTER is its value in seconds, and is waited at least."""
+	def delay(self, attempt, retry_after=None):
+		delay = min(self.max_backoff, self.backoff * (2 ** attempt))
+
+		if self.jitter:
+			delay = random.uniform(0, delay)
+
+		if retry_after is not None:
+			delay = max(delay, retry_after)
+
+		return delay
+
+
+#
+class CircuitBreaker:
+
+	"""A circuit breaker for a single region. After FAILURE_THRESHOLD consecutive transient failures, the circuit
+	   opens and requests to the region fail immediately for RESET_TIMEOUT seconds. Then a single trial request
+	   is let through: the circuit closes again if it succeeds, or stays open for another RESET_TIMEOUT if it fails.
+
+	   PARAMS:
+	   failure_threshold: Number of consecutive failures that opens the circuit.
+	   reset_timeout: Number of seconds the circuit stays open before a trial request."""
+	def __init__(self, failure_threshold=5, reset_timeout=30):
+		self.failure_threshold = failure_threshold
+		self.reset_timeout = reset_timeout
+
+		self.failures = 0
+		self.opened_at = None
+
+		self._trial_in_flight = False
+		self._lock = threading.Lock()
+
+
+	"""Return True if a request may be sent now, or False if the circuit is open."""
+	def allow(self):
+		with self._lock:
+			if self.opened_at is None:
+				return True
+
+			if self._trial_in_flight or time.monotonic() - self.opened_at < self.reset_timeout:
+				return False
+
+			self._trial_in_flight = True
+
+			return True
+
+
+	"""Record a request that reached the region, and close the circuit."""
+	def record_success(self):
+		with self._lock:
+			self.failures = 0
+			self.opened_at = None
+			self._trial_in_flight = False
+
+
+	"""Record a transient failure of a request, and open the circuit if there were too many in a row."""
+	def record_failure(self):
+		with self._lock:
+			self.failures += 1
+
+			if self._trial_in_flight or self.failures >= self.failure_threshold:
+				self.opened_at = time.monotonic()
+
+			self._trial_in_flight = False
+
+
+	"""Give up the trial request without recording its outcome (e.g. after an error that says nothing about the
+	   region), so that the next request can be the trial. Does nothing if no trial request is in flight."""
+	def release_trial(self):
+		with self._lock:
+			self._trial_in_flight = False
+
+
+	"""Return the state of the circuit: "closed", "open", or "half-open" (a trial request is allowed)."""
+	def state(self):
+		with self._lock:
+			if self.opened_at is None:
+				return "closed"
+
+			if self._trial_in_flight or time.monotonic() - self.opened_at >= self.reset_timeout:
+				return "half-open"
+
+			return "open"
@@ -0,0 +1,87 @@
+##################################################
+# Guild roster processing.                       #
+# diff_rosters: Changes between two rosters.     #
+# load_roster/save_roster: Rosters stored in     #
+# json files.                                    #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import json
+import os
+
+from .files import atomic_write
+
+
+"""Return the key of MEMBER, a member of a guild roster (see WoWGuild.get_members_data()): its (name, realm) pair."""
+def member_key(member):
+	return member['character']['name'], member['character']['realm']
+
+
+"""Return the spec name of MEMBER, or None if it has no spec."""
+def _member_spec(member):
+	spec = member['character'].get('spec')
+
+	return spec['name'] if spec is not None else None
+
+
+"""Return the changes between OLD and NEW, two rosters of the same guild (lists of members, see
+   WoWGuild.get_members_data()), with members matched on their (name, realm) pairs.
+
+   Returns a dictionary with the keys:
+   joined: List of the members of NEW that are not in OLD.
+   left: List of the members of OLD that are not in NEW.
+   rank_changed, level_changed, spec_changed: Lists of (member, old value, new value) tuples of the members of NEW
+                                              whose rank, level, or spec name changed.
+   changed: List of the members of NEW that joined or changed in any of those ways, e.g. to only process them again."""
+def diff_rosters(old, new):
+	old_members = {member_key(member): member for member in old}
+	new_members = {member_key(member): member for member in new}
+
+	changes = {'joined': [], 'left': [], 'rank_changed': [], 'level_changed': [], 'spec_changed': [], 'changed': []}
+
+	for key in old_members.keys() - new_members.keys():
+		changes['left'].append(old_members[key])
+
+	for key, member in new_members.items():
+		previous = old_members.get(key)
+
+		if previous is None:
+			changes['joined'].append(member)
+			changes['changed'].append(member)
+			continue
+
+		changed = False
+
+		if previous['rank'] != member['rank']:
+			changes['rank_changed'].append((member, previous['rank'], member['rank']))
+			changed = True
+
+		if previous['character'].get('level') != member['character'].get('level'):
+			changes['level_changed'].append((member, previous['character'].get('level'), member['character'].get('level')))
+			changed = True
+
+		if _member_spec(previous) != _member_spec(member):
+			changes['spec_changed'].append((member, _member_spec(previous), _member_spec(member)))
+			changed = True
+
+		if changed:
+			changes['changed'].append(member)
+
+	return changes
+
+
+"""Return the roster stored in the json file at PATH, or an empty list if there is no such file."""
+def load_roster(path):
+	if not os.path.exists(path):
+		return []
+
+	with open(path, encoding='utf-8') as f:
+		return json.load(f)
+
+
+"""Store MEMBERS, a roster, in a json file at PATH. The file is replaced at once, so it always holds a whole roster."""
+def save_roster(path, members):
+	with atomic_write(path, 'w', encoding='utf-8') as f:
+		json.dump(members, f)
@@ -8,8 +8,7 @@
 # Written by Lewis Kim.                          #
 ##################################################
 
-import requests
-import urllib, json
+from .transport import get_default_transport, BlizzardAPIError
 
 # Accepted API locales. zh_TW has been excluded for now due to continuous "503 Service Unavailable" errors from the Blizzard API.
 # To add: zh_TW
@@ -20,7 +19,7 @@ accepted_locales = ["en_US", "en_GB", "ko_KR"]
 class SC2Profile:
 
 	"""."""
-	def __init__(self, api_key, profile_id, profile_name, region_id=1, locale="en_US", token=None):
+	def __init__(self, api_key, profile_id, profile_name, region_id=1, locale="en_US", token=None, transport=None):
 		# Check if the user-given locale is supported, i.e. is one of Blizzard's regions.
 		if locale not in accepted_locales:
 			raise ValueError("Not supported locale.")
@@ -39,6 +38,7 @@ class SC2Profile:
 		# 	self.root = "https://tw.api.battle.net"
 
 		self.api_key = api_key
+		self.transport = transport if transport is not None else get_default_transport()
 
 		self.profile_id = profile_id
 		self.region_id = region_id
@@ -104,11 +104,13 @@ class SC2Profile:
 	"""."""
 	def get_profile_data(self):
 		try:
-			with urllib.request.urlopen(self._get_profile_data_url()) as url:
-				self.profile_data = json.loads(url.read().decode())
+			self.profile_data = self.transport.get_json(self._get_profile_data_url())
 
 			return self.profile_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -256,11 +258,13 @@ class SC2Profile:
 	"""."""
 	def get_profile_ladder_data(self):
 		try:
-			with urllib.request.urlopen(self._get_profile_ladders_data_url()) as url:
-				self.ladders_data = json.loads(url.read().decode())
+			self.ladders_data = self.transport.get_json(self._get_profile_ladders_data_url())
 
 			return self.ladders_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -304,11 +308,13 @@ class SC2Profile:
 	"""."""
 	def get_match_history_data(self):
 		try:
-			with urllib.request.urlopen(self._get_match_history_data_url()) as url:
-				self.match_history = json.loads(url.read().decode())
+			self.match_history = self.transport.get_json(self._get_match_history_data_url())
 
 			return self.match_history
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -358,7 +364,7 @@ class SC2Profile:
 class SC2Ladder:
 
 	"""."""
-	def __init__(self, api_key, ladder_id, locale="en_US", token=None):
+	def __init__(self, api_key, ladder_id, locale="en_US", token=None, transport=None):
 		# Check if the user-given locale is supported, i.e. is one of Blizzard's regions.
 		if locale not in accepted_locales:
 			raise ValueError("Not supported locale.")
@@ -377,6 +383,7 @@ class SC2Ladder:
 		# 	self.root = "https://tw.api.battle.net"
 
 		self.api_key = api_key
+		self.transport = transport if transport is not None else get_default_transport()
 
 		self.ladder_id = ladder_id
 
@@ -404,11 +411,13 @@ class SC2Ladder:
 	"""."""
 	def get_ladder_data(self):
 		try:
-			with urllib.request.urlopen(self._get_ladder_data_url()) as url:
-				self.ladder_data = json.loads(url.read().decode())
+			self.ladder_data = self.transport.get_json(self._get_ladder_data_url())
 
 			return self.ladder_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -472,7 +481,7 @@ class SC2Ladder:
 class SC2Resources:
 
 	"""."""
-	def __init__(self, api_key, locale="en_US", token=None):
+	def __init__(self, api_key, locale="en_US", token=None, transport=None):
 		# Check if the user-given locale is supported, i.e. is one of Blizzard's regions.
 		if locale not in accepted_locales:
 			raise ValueError("Not supported locale.")
@@ -491,6 +500,7 @@ class SC2Resources:
 		# 	self.root = "https://tw.api.battle.net"
 
 		self.api_key = api_key
+		self.transport = transport if transport is not None else get_default_transport()
 
 		self.locale = locale
 
@@ -528,11 +538,13 @@ class SC2Resources:
 	"""."""
 	def get_achievements_data(self):
 		try:
-			with urllib.request.urlopen(self._get_achievements_data_url()) as url:
-				self.achievements_data = json.loads(url.read().decode())
+			self.achievements_data = self.transport.get_json(self._get_achievements_data_url())
 
 			return self.achievements_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -560,11 +572,13 @@ class SC2Resources:
 	"""."""
 	def get_rewards_data(self):
 		try:
-			with urllib.request.urlopen(self._get_rewards_data_url()) as url:
-				self.rewards_data = json.loads(url.read().decode())
+			self.rewards_data = self.transport.get_json(self._get_rewards_data_url())
 
 			return self.rewards_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, profile ID, region ID, or profile name.")
 			return
@@ -0,0 +1,71 @@
+##################################################
+# Request coalescing for concurrent identical    #
+# fetches.                                       #
+# SingleFlight: One in-flight call per key,      #
+# shared by every caller asking for that key.    #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import threading
+
+
+#
+class _Call:
+
+	"""An in-flight call of SingleFlight, and its outcome once it is done."""
+	def __init__(self):
+		self.done = threading.Event()
+		self.result = None
+		self.error = None
+
+
+#
+class SingleFlight:
+
+	"""Coalesces concurrent calls with the same key: while a call for a key is in flight, other threads asking
+	   for the same key wait for it and share its result (or its exception), instead of making their own call.
+	   Once the call is done, the next call for the key runs again."""
+	def __init__(self):
+		self._calls = {}
+		self._lock = threading.Lock()
+
+
+	"""Return FUNC(), or the result of the call of FUNC already in flight for KEY."""
+	def do(self, key, func):
+		with self._lock:
+			call = self._calls.get(key)
+			leader = call is None
+
+			if leader:
+				call = _Call()
+				self._calls[key] = call
+
+		if not leader:
+			call.done.wait()
+
+			if call.error is not None:
+				raise call.error
+
+			return call.result
+
+		try:
+			call.result = func()
+
+			return call.result
+
+		except BaseException as e:
+			call.error = e
+			raise
+
+		finally:
+			with self._lock:
+				del self._calls[key]
+
+			call.done.set()
+
+
+	"""Return the number of calls in flight."""
+	def __len__(self):
+		return len(self._calls)
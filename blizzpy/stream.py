@@ -0,0 +1,150 @@
+##################################################
+# Incremental json parsing of big API responses, #
+# e.g. auction house dumps.                      #
+# JSONArrayParser: Parses the elements of a json #
+# array while the document downloads.            #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import codecs
+import json
+import mmap
+import re
+
+
+_separators = re.compile(r"[\s,]*")
+_delimiters = " \t\n\r,]"
+
+
+#
+class JSONArrayParser:
+
+	"""An incremental parser of the array under the key KEY of a json document, e.g. "auctions" in an auction house
+	   dump. The document is fed in chunks of bytes as it downloads, and each element of the array is returned as soon
+	   as it is complete, so that only one element (and at most one chunk) is held in memory at a time.
+
+	   The array is the first one found under KEY, which must not appear as a key of anything before it.
+
+	   PARAMS:
+	   key: Key of the array to parse."""
+	def __init__(self, key):
+		self.key = key
+		self.done = False
+
+		self._pattern = re.compile('"' + re.escape(key) + r'"\s*:\s*\[')
+		self._decoder = json.JSONDecoder()
+		self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+		self._started = False
+		self._buffer = ""
+		self._pos = 0
+
+
+	"""Feed CHUNK, the next bytes of the document, and return the list of the array elements it completed."""
+	def feed(self, chunk):
+		self._buffer = self._buffer[self._pos:] + self._text_decoder.decode(chunk)
+		self._pos = 0
+
+		return self._parse(final=False)
+
+
+	"""Signal the end of the document, and return the list of the remaining array elements.
+
+	   Raises ValueError if the document ended before the end of the array."""
+	def close(self):
+		self._buffer = self._buffer[self._pos:] + self._text_decoder.decode(b"", final=True)
+		self._pos = 0
+
+		elements = self._parse(final=True)
+
+		if not self.done:
+			raise ValueError("Json document ended before the end of the array under \"" + self.key + "\".")
+			return
+
+		return elements
+
+
+	"""Parse every complete array element in the buffer, and return them in a list. Unless FINAL, an element cut by
+	   the end of the buffer is left in the buffer until the next chunk completes it."""
+	def _parse(self, final):
+		elements = []
+
+		if not self._started:
+			match = self._pattern.search(self._buffer)
+
+			if match is None:
+				# Keep the end of the buffer, in case the key is cut between two chunks.
+				self._pos = max(0, len(self._buffer) - len(self.key) - 64)
+
+				return elements
+
+			self._started = True
+			self._pos = match.end()
+
+		while not self.done:
+			pos = _separators.match(self._buffer, self._pos).end()
+
+			if pos == len(self._buffer):
+				self._pos = pos
+				break
+
+			if self._buffer[pos] == "]":
+				self.done = True
+				self._pos = pos + 1
+				break
+
+			try:
+				element, end = self._decoder.raw_decode(self._buffer, pos)
+
+			except json.JSONDecodeError:
+				if final:
+					raise
+
+				self._pos = pos
+				break
+
+			# A number cut by the end of the buffer (e.g. "12" of "12.5") may go on in the next chunk.
+			if not final and (end == len(self._buffer) or self._buffer[end] not in _delimiters):
+				self._pos = pos
+				break
+
+			elements.append(element)
+			self._pos = end
+
+		return elements
+
+
+"""Yield the elements of the array under the key KEY of a json document, from CHUNKS, an iterable of the bytes
+   of the document (e.g. Transport.stream()). See JSONArrayParser."""
+def iter_json_array(chunks, key):
+	parser = JSONArrayParser(key)
+
+	for chunk in chunks:
+		for element in parser.feed(chunk):
+			yield element
+
+		if parser.done:
+			break
+
+	for element in parser.close():
+		yield element
+
+
+"""Yield the elements of the array under the key KEY of the json document in the file at PATH (see iter_json_array()).
+   The file is memory-mapped and parsed in chunks of CHUNK_SIZE bytes, so neither its bytes nor its text are copied
+   in memory as a whole."""
+def iter_json_array_file(path, key, chunk_size=1024 * 1024):
+	with open(path, 'rb') as f:
+		# Empty files can't be memory-mapped.
+		if not f.seek(0, 2):
+			for element in iter_json_array([], key):
+				yield element
+
+			return
+
+		with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+			chunks = (view[start:start + chunk_size] for start in range(0, len(view), chunk_size))
+
+			for element in iter_json_array(chunks, key):
+				yield element
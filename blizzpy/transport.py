@@ -0,0 +1,333 @@
+##################################################
+# The HTTP transport shared by every BlizzPy     #
+# client class.                                  #
+# Transport: Pooled keep-alive HTTP sessions.    #
+# BlizzardAPIError: Errors raised by transports. #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import MemoryCache, default_max_bytes, default_max_entry_bytes, cache_key, cache_ttl, entry_from_response, get_shared_cache
+from .ratelimit import get_default_rate_limiter
+from .retry import RetryPolicy, CircuitBreaker
+from .singleflight import SingleFlight
+
+
+#
+class BlizzardAPIError(ValueError):
+
+	"""Base class of the errors raised by BlizzPy transports for API-side failures (as opposed to bad API keys,
+	   character names, etc.), so that they are not reported as "Could not retrieve data. Please check your API key".
+	   Subclasses ValueError, for code that already catches the ValueErrors raised by BlizzPy objects."""
+	pass
+
+
+#
+class RateLimitError(BlizzardAPIError):
+
+	"""Raised when the Blizzard API rejects a request with "429 Too Many Requests".
+
+	   PARAMS:
+	   retry_after: Number of seconds the API asked to wait before retrying, or None."""
+	def __init__(self, message, retry_after=None):
+		super().__init__(message)
+
+		self.retry_after = retry_after
+
+
+#
+class ServiceUnavailableError(BlizzardAPIError):
+
+	"""Raised when a request keeps failing with a transient error (a timeout, a dropped connection, or a 5xx status)
+	   after every retry.
+
+	   PARAMS:
+	   retry_after: Number of seconds the API asked to wait before retrying, or None."""
+	def __init__(self, message, retry_after=None):
+		super().__init__(message)
+
+		self.retry_after = retry_after
+
+
+#
+class CircuitOpenError(ServiceUnavailableError):
+
+	"""Raised without sending the request when the circuit breaker of a region is open, i.e. when the region has
+	   failed too many times in a row recently."""
+	pass
+
+
+"""Return the error to raise for an HTTP response with status STATUS and headers HEADERS to URL,
+   if the status is transient (429 or 5xx). Otherwise, return None."""
+def transient_error(status, url, headers):
+	if status == 429:
+		return RateLimitError("Blizzard API rate limit exceeded (429 Too Many Requests): " + redact_url(url), parse_retry_after(headers))
+
+	if status >= 500:
+		return ServiceUnavailableError("Blizzard API unavailable (" + str(status) + "): " + redact_url(url), parse_retry_after(headers))
+
+	return None
+
+
+"""Return URL with its apikey parameter hidden, for error messages."""
+def redact_url(url):
+	return re.sub(r"apikey=[^&]*", "apikey=...", url)
+
+
+"""Return the Retry-After header value of HEADERS in seconds, or None if missing or invalid.
+   The header is either a number of seconds or an HTTP date."""
+def parse_retry_after(headers):
+	value = headers.get("Retry-After")
+
+	if value is None:
+		return None
+
+	try:
+		return max(0.0, float(value))
+
+	except ValueError:
+		pass
+
+	try:
+		return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+
+	except (TypeError, ValueError, IndexError):
+		return None
+
+
+#
+class Transport:
+
+	"""A pluggable HTTP transport that keeps one pooled keep-alive session per API host (i.e. per region),
+	   so that consecutive requests to us.api.battle.net, eu.api.battle.net, etc. reuse open TCP/TLS connections.
+
+	   PARAMS:
+	   pool_connections: Number of connection pools to cache per session.
+	   pool_maxsize: Maximum number of open connections kept alive per host.
+	   timeout: Timeout (in seconds) for each request.
+	   rate_limiter: RateLimiter every request goes through. If None, use the process-wide default RateLimiter.
+	   retry: RetryPolicy of requests that fail with a transient error. If None, use RetryPolicy().
+	   failure_threshold: Number of consecutive transient failures of a region that opens its circuit breaker.
+	   reset_timeout: Number of seconds an open circuit breaker fails requests to its region immediately.
+	   cache: Cache of decoded responses and their validators (ETag/Last-Modified), e.g. a MemoryCache or a
+	          SQLiteCache. If None, use the process-wide shared cache if it is turned on (see enable_shared_cache()),
+	          or a MemoryCache of this transport otherwise, which holds at most 64 MB of responses of 2 MB or less.
+	   conditional: If True, revalidate cached responses with conditional requests, and reuse the cached data
+	                when the API answers "304 Not Modified"."""
+	def __init__(self, pool_connections=4, pool_maxsize=16, timeout=30, rate_limiter=None, retry=None,
+		failure_threshold=5, reset_timeout=30, cache=None, conditional=True):
+		self.pool_connections = pool_connections
+		self.pool_maxsize = pool_maxsize
+		self.timeout = timeout
+		self.rate_limiter = rate_limiter
+		self.retry = retry if retry is not None else RetryPolicy()
+		self.failure_threshold = failure_threshold
+		self.reset_timeout = reset_timeout
+		self.cache = cache
+		self.conditional = conditional
+
+		self._sessions = {}
+		self._breakers = {}
+		self._own_cache = MemoryCache(max_bytes=default_max_bytes, max_entry_bytes=default_max_entry_bytes)
+		self._flight = SingleFlight()
+		self._lock = threading.Lock()
+
+
+	"""Return the pooled session for the host of URL, creating it on first use."""
+	def _get_session(self, url):
+		host = urlsplit(url).netloc
+
+		with self._lock:
+			session = self._sessions.get(host)
+
+			if session is None:
+				session = requests.Session()
+				adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+				session.mount("https://", adapter)
+				session.mount("http://", adapter)
+
+				self._sessions[host] = session
+
+		return session
+
+
+	"""Return the circuit breaker of the host (i.e. region) of URL, creating it on first use."""
+	def get_circuit_breaker(self, url):
+		host = urlsplit(url).netloc
+
+		with self._lock:
+			breaker = self._breakers.get(host)
+
+			if breaker is None:
+				breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+				self._breakers[host] = breaker
+
+		return breaker
+
+
+	"""Return the cache of this transport."""
+	def _get_cache(self):
+		if self.cache is not None:
+			return self.cache
+
+		shared_cache = get_shared_cache()
+
+		return shared_cache if shared_cache is not None else self._own_cache
+
+
+	"""Return the RateLimiter of this transport."""
+	def _get_rate_limiter(self):
+		return self.rate_limiter if self.rate_limiter is not None else get_default_rate_limiter()
+
+
+	"""Send a GET request to URL over the pooled session of its host, once the rate limiter allows it,
+	   and return the requests.Response. Transient failures are retried according to self.retry.
+
+	   Raises RateLimitError or ServiceUnavailableError if the request still fails after every retry,
+	   CircuitOpenError if the region's circuit breaker is open, or requests.HTTPError for any other error status."""
+	def get(self, url, headers=None, stream=False):
+		breaker = self.get_circuit_breaker(url)
+		attempt = 0
+
+		while True:
+			if not breaker.allow():
+				raise CircuitOpenError("Blizzard API region is failing, not sending request: " + redact_url(url))
+				return
+
+			try:
+				self._get_rate_limiter().acquire()
+
+				try:
+					response = self._get_session(url).get(url, headers=headers, stream=stream, timeout=self.timeout)
+
+				except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+					error = ServiceUnavailableError("Could not reach the Blizzard API (" + type(e).__name__ + "): " + redact_url(url))
+
+				else:
+					error = transient_error(response.status_code, url, response.headers)
+
+					if error is not None:
+						response.close()
+
+			# Any other error says nothing about the region, but must not leave a trial request in flight forever.
+			except:
+				breaker.release_trial()
+				raise
+
+			if error is None:
+				breaker.record_success()
+				response.raise_for_status()
+
+				return response
+
+			# A 429 means the region is up, but this API key is over its quota.
+			if isinstance(error, RateLimitError):
+				breaker.record_success()
+
+			else:
+				breaker.record_failure()
+
+			if attempt >= self.retry.max_retries:
+				raise error
+				return
+
+			time.sleep(self.retry.delay(attempt, getattr(error, 'retry_after', None)))
+			attempt += 1
+
+
+	"""Return the body of URL decoded from json.
+
+	   If a response of URL is cached and still fresh (see TTLPolicy), the cached data is returned without sending
+	   a request. If it is stale, the request is sent with its validators (If-None-Match/If-Modified-Since), and the
+	   cached data is returned as-is, without downloading or decoding the body again, if the API answers
+	   "304 Not Modified".
+
+	   Concurrent calls for the same URL (ignoring apikey) are coalesced: a single request is sent and decoded,
+	   and its data is returned to every caller."""
+	def get_json(self, url):
+		return self._flight.do(cache_key(url), lambda: self._get_json(url))
+
+
+	"""Return the body of URL decoded from json. See get_json()."""
+	def _get_json(self, url):
+		if not self.conditional:
+			return self.get(url).json()
+
+		cache = self._get_cache()
+		key = cache_key(url)
+		entry = cache.get(key)
+
+		if entry is not None and entry.is_fresh():
+			return entry.data
+
+		response = self.get(url, headers=entry.validators() if entry is not None else None)
+
+		if response.status_code == 304 and entry is not None:
+			entry.refresh(cache_ttl(cache, url))
+			cache.set(key, entry)
+
+			return entry.data
+
+		data = response.json()
+		entry = entry_from_response(data, response.headers, len(response.content), cache_ttl(cache, url))
+
+		if entry is not None:
+			cache.set(key, entry)
+
+		return data
+
+
+	"""Yield the body of URL in chunks of at most CHUNK_SIZE bytes as it downloads, without caching it,
+	   e.g. for iter_json_array(). Raises the same errors as get()."""
+	def stream(self, url, chunk_size=64 * 1024):
+		response = self.get(url, stream=True)
+
+		try:
+			for chunk in response.iter_content(chunk_size):
+				yield chunk
+
+		finally:
+			response.close()
+
+
+	"""Close every pooled session and the connections they hold."""
+	def close(self):
+		with self._lock:
+			for session in self._sessions.values():
+				session.close()
+
+			self._sessions = {}
+
+
+# The process-wide transport used by every client class that isn't given its own.
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+
+"""Return the process-wide default Transport, creating it on first use."""
+def get_default_transport():
+	global _default_transport
+
+	with _default_transport_lock:
+		if _default_transport is None:
+			_default_transport = Transport()
+
+		return _default_transport
+
+
+"""Replace the process-wide default Transport with TRANSPORT, e.g. to change pool sizes or timeouts."""
+def set_default_transport(transport):
+	global _default_transport
+
+	with _default_transport_lock:
+		_default_transport = transport
@@ -0,0 +1,50 @@
+##################################################
+# Worker pool helpers for running many BlizzPy   #
+# requests concurrently.                         #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+"""Call FUNC on every element of ITEMS in a pool of MAX_CONCURRENCY threads, with at most MAX_CONCURRENCY
+   calls in flight at once (ITEMS is consumed lazily, so it can be a generator).
+
+   Yields (item, result, error) tuples in the order the calls complete. ERROR is the exception raised by
+   FUNC(item), or None if the call succeeded (in which case RESULT is its return value)."""
+def imap_bounded(func, items, max_concurrency=8):
+	if max_concurrency < 1:
+		raise ValueError("max_concurrency must be at least 1.")
+		return
+
+	items = iter(items)
+
+	with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+		pending = {}
+
+		for item in items:
+			pending[executor.submit(func, item)] = item
+
+			if len(pending) >= max_concurrency:
+				break
+
+		while pending:
+			done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+			for future in done:
+				item = pending.pop(future)
+				error = future.exception()
+
+				if error is None:
+					yield item, future.result(), None
+
+				else:
+					yield item, None, error
+
+			for item in items:
+				pending[executor.submit(func, item)] = item
+
+				if len(pending) >= max_concurrency:
+					break
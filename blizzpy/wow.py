@@ -11,10 +11,16 @@
 # Written by Lewis Kim.                       #
 ###############################################
 
-import requests
-import urllib, json
 import pandas as pd
 
+from .transport import get_default_transport, BlizzardAPIError
+from .auction import AuctionSnapshot
+from .files import atomic_write
+from .news import NewsCursor, guild_key
+from .roster import diff_rosters, load_roster, save_roster
+from .stream import iter_json_array, iter_json_array_file
+from .workers import imap_bounded
+
 # Accepted API locales. zh_TW has been excluded for now due to continuous "503 Service Unavailable" errors from the Blizzard API.
 # To add: zh_TW
 accepted_locales = ["en_US", "en_GB", "ko_KR"]
@@ -38,6 +44,23 @@ class_to_spec = {'Warrior': ['arms', 'fury', 'protection'], 'Paladin': ['holy',
 	'Warlock': ['affliction', 'demonology', 'destruction'], 'Monk': ['brewmaster', 'mistweaver', 'windwalker'], 
 	'Druid': ['balance', 'feral', 'guardian', 'restoration'], 'Demon Hunter': ['havoc', 'vengeance']}
 
+# Categorical dtypes of the class, race, spec and role columns of WoWGuild.get_members_df(). The categories are the same
+# for every guild, so that the columns stay categorical when the rosters of many guilds are concatenated.
+class_dtype = pd.CategoricalDtype(list(int_to_class.values()))
+race_dtype = pd.CategoricalDtype(list(int_to_race.values()))
+spec_dtype = pd.CategoricalDtype(sorted({spec.title() for specs in class_to_spec.values() for spec in specs}))
+role_dtype = pd.CategoricalDtype(['DPS', 'HEALING', 'TANK'])
+
+# A dictionary that maps each WoWCharacter field accepted by the API to the attribute it is cached in,
+# and the keys leading to the cached value in the json data, e.g. 'pvp': ('pvp_data', ['pvp', 'brackets'])
+character_fields = {'achievements': ('ach_data', ['achievements']), 'appearance': ('appearance_data', ['appearance']),
+	'feed': ('feed_data', ['feed']), 'guild': ('guild_data', ['guild']), 'hunterPets': ('hunter_pet_data', ['hunterPets']),
+	'items': ('items_data', ['items']), 'mounts': ('mounts_data', ['mounts']), 'pets': ('pets_data', ['pets']),
+	'professions': ('professions_data', ['professions']), 'progression': ('raid_prog_data', ['progression', 'raids']),
+	'pvp': ('pvp_data', ['pvp', 'brackets']), 'quests': ('quests_data', ['quests']), 'reputation': ('rep_data', ['reputation']),
+	'statistics': ('statistics_data', ['statistics']), 'stats': ('stats_data', ['stats']), 'talents': ('talents_data', ['talents']),
+	'titles': ('titles_data', ['titles'])}
+
 
 # 
 # Currently suppo
@@ -51,7 +74,7 @@ class WoWCharacter:
 	   self.locale:
 	   self.characterName:
 	   self.realm:"""
-	def __init__(self, api_key, characterName, realm, locale="en_US", token=None):
+	def __init__(self, api_key, characterName, realm, locale="en_US", token=None, transport=None):
 		# Check if the user-given locale is supported, i.e. is one of Blizzard's regions.
 		if locale not in accepted_locales:
 			raise ValueError("Not supported locale.")
@@ -71,6 +94,7 @@ class WoWCharacter:
 
 		# Basic attributes for request URLs.
 		self.api_key = api_key
+		self.transport = transport if transport is not None else get_default_transport()
 		self.locale = locale
 
 		self.characterName = characterName
@@ -134,15 +158,105 @@ class WoWCharacter:
 	   calcClass, faction, totalHonorableKills."""
 	def get_character_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_url()) as url:
-				self.character_data = json.loads(url.read().decode())
+			self.character_data = self.transport.get_json(self._get_data_url())
 
 			return self.character_data
 
+		except BlizzardAPIError:
+			raise
+
+		except:
+			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
+			return
+
+
+	"""Fetch FIELDS (a list of keys of character_fields) of self.characterName in a single request, and fill
+	   self.character_data and the per-field datasets (self.items_data, self.pvp_data, self.rep_data, etc.) with them.
+	   If FIELDS is None, fetch every field.
+
+	   Returns self.character_data."""
+	def prefetch(self, fields=None):
+		fields = self._check_fields(fields)
+
+		try:
+			data = self.transport.get_json(self._get_data_with_field_url(",".join(fields)))
+
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
 
+		return self._fill_fields(fields, data)
+
+
+	"""Return FIELDS as a list, or every key of character_fields if FIELDS is None.
+	   Raises ValueError if any of FIELDS is not a key of character_fields."""
+	@staticmethod
+	def _check_fields(fields):
+		if fields is None:
+			return list(character_fields.keys())
+
+		for field in fields:
+			if field not in character_fields:
+				raise ValueError("Invalid field: " + str(field) + ". See character_fields for the accepted fields.")
+				return
+
+		return list(fields)
+
+
+	"""Fill self.character_data and the datasets of FIELDS from DATA, the json data of a request for FIELDS.
+
+	   Returns self.character_data."""
+	def _fill_fields(self, fields, data):
+		for field in fields:
+			if field not in data:
+				continue
+
+			attribute, keys = character_fields[field]
+			value = data[field]
+
+			for key in keys[1:]:
+				value = value[key]
+
+			setattr(self, attribute, value)
+
+		self.character_data = {key: value for key, value in data.items() if key not in character_fields}
+
+		return self.character_data
+
+
+	"""Fetch every field of self.characterName in a single request. See prefetch() for details."""
+	def load_all(self):
+		return self.prefetch()
+
+
+	"""Fetch many characters concurrently, with at most MAX_CONCURRENCY requests in flight.
+	   CHARACTERS is an iterable of (characterName, realm) tuples. Each character is fetched in a single request
+	   with prefetch(FIELDS), or with get_character_data() if FIELDS is None.
+
+	   Yields (character, error) tuples in the order the requests complete, where CHARACTER is the WoWCharacter
+	   and ERROR is None, or the exception raised while fetching it."""
+	@classmethod
+	def fetch_many(cls, api_key, characters, fields=None, locale="en_US", max_concurrency=8, token=None, transport=None):
+		if fields is not None:
+			fields = cls._check_fields(fields)
+
+		def fetch(character):
+			if fields is None:
+				character.get_character_data()
+
+			else:
+				character.prefetch(fields)
+
+			return character
+
+		instances = (cls(api_key, characterName, realm, locale, token, transport) for characterName, realm in characters)
+
+		for character, _, error in imap_bounded(fetch, instances, max_concurrency):
+			yield character, error
+
 
 	"""Return self.characterName's class. See int_to_class for details."""
 	def get_class(self):
@@ -211,11 +325,13 @@ class WoWCharacter:
 	   criteriaTimestamp, criteriaCreated"""
 	def get_achievements_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("achievements")) as url:
-				self.ach_data = json.loads(url.read().decode())['achievements']
+			self.ach_data = self.transport.get_json(self._get_data_with_field_url("achievements"))['achievements']
 
 			return self.ach_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -253,11 +369,13 @@ class WoWCharacter:
 	         customDisplayOptions"""
 	def get_appearance_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("appearance")) as url:
-				self.appearance_data = json.loads(url.read().decode())['appearance']
+			self.appearance_data = self.transport.get_json(self._get_data_with_field_url("appearance"))['appearance']
 
 			return self.appearance_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -300,11 +418,13 @@ class WoWCharacter:
 	"""Return Return self.characterName's activity data as a dictionary, decoded from json."""
 	def get_feed_data(self, as_df=False):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("feed")) as url:
-				self.feed_data = json.loads(url.read().decode())['feed']
+			self.feed_data = self.transport.get_json(self._get_data_with_field_url("feed"))['feed']
 
 			return self.feed_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -315,11 +435,13 @@ class WoWCharacter:
 	"""Return self.characterName's guild data as a dictionary, decoded from json."""
 	def get_guild_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("guild")) as url:
-				self.guild_data = json.loads(url.read().decode())['guild']
+			self.guild_data = self.transport.get_json(self._get_data_with_field_url("guild"))['guild']
 
 			return self.guild_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -370,11 +492,13 @@ class WoWCharacter:
 				return
 
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("hunterPets")) as url:
-				self.hunter_pet_data = json.loads(url.read().decode())['hunterPets']
+			self.hunter_pet_data = self.transport.get_json(self._get_data_with_field_url("hunterPets"))['hunterPets']
 
 			return self.hunter_pet_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -407,11 +531,13 @@ class WoWCharacter:
 	"""Return self.characterName's items data, decoded from json."""
 	def get_items_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("items")) as url:
-				self.items_data = json.loads(url.read().decode())['items']
+			self.items_data = self.transport.get_json(self._get_data_with_field_url("items"))['items']
 
 			return self.items_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -442,11 +568,13 @@ class WoWCharacter:
 	"""Return self.characterName's mounts data, decoded from json."""
 	def get_mounts_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("mounts")) as url:
-				self.mounts_data = json.loads(url.read().decode())['mounts']
+			self.mounts_data = self.transport.get_json(self._get_data_with_field_url("mounts"))['mounts']
 
 			return self.mounts_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -501,13 +629,15 @@ class WoWCharacter:
 	"""Return self.characterName's non-hunter pets data, decoded from json."""
 	def get_pets_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("pets")) as url:
-				self.pets_data = json.loads(url.read().decode())['pets']
+			self.pets_data = self.transport.get_json(self._get_data_with_field_url("pets"))['pets']
 
 			return self.pets_data
 
 			return 
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -586,11 +716,13 @@ class WoWCharacter:
 	"""Return self.characterName's professions data, decoded from json."""
 	def get_professions_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("professions")) as url:
-				self.professions_data = json.loads(url.read().decode())['professions']
+			self.professions_data = self.transport.get_json(self._get_data_with_field_url("professions"))['professions']
 
 			return self.professions_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -629,13 +761,15 @@ class WoWCharacter:
 	"""Return self.characterName's raid progression data, decoded from json."""
 	def get_raid_prog_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("progression")) as url:
-				raid_prog_data = json.loads(url.read().decode())['progression']
+			raid_prog_data = self.transport.get_json(self._get_data_with_field_url("progression"))['progression']
 
 			self.raid_prog_data = raid_prog_data['raids']
 
 			return self.raid_prog_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -734,13 +868,15 @@ class WoWCharacter:
 	"""Return self.characterName's PVP data, decoded from json."""
 	def get_pvp_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("pvp")) as url:
-				pvp_data = json.loads(url.read().decode())['pvp']
+			pvp_data = self.transport.get_json(self._get_data_with_field_url("pvp"))['pvp']
 
 			self.pvp_data = pvp_data['brackets']
 
 			return self.pvp_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -871,11 +1007,13 @@ class WoWCharacter:
 	"""Return self.characterName's reputations data, decoded from json."""
 	def get_reputation_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("reputation")) as url:
-				self.rep_data = json.loads(url.read().decode())['reputation']
+			self.rep_data = self.transport.get_json(self._get_data_with_field_url("reputation"))['reputation']
 
 			return self.rep_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -985,11 +1123,13 @@ class WoWCharacter:
 	"""Return self.characterName's quests data, decoded from json."""
 	def get_quests_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("quests")) as url:
-				self.quests_data = json.loads(url.read().decode())['quests']
+			self.quests_data = self.transport.get_json(self._get_data_with_field_url("quests"))['quests']
 
 			return self.quests_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -1012,11 +1152,13 @@ class WoWCharacter:
 	"""Return self.characterName's gameplay statistics data, decoded from json."""
 	def get_statistics_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("statistics")) as url:
-				self.statistics_data = json.loads(url.read().decode())['statistics']
+			self.statistics_data = self.transport.get_json(self._get_data_with_field_url("statistics"))['statistics']
 
 			return self.statistics_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -1027,11 +1169,13 @@ class WoWCharacter:
 	"""Return self.characterName's in-game stats data, decoded from json."""
 	def get_stats_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("stats")) as url:
-				self.stats_data = json.loads(url.read().decode())['stats']
+			self.stats_data = self.transport.get_json(self._get_data_with_field_url("stats"))['stats']
 
 			return self.stats_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -1042,11 +1186,13 @@ class WoWCharacter:
 	"""Return self.characterName's talents data, decoded from json."""
 	def get_talents_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("talents")) as url:
-				self.talents_data = json.loads(url.read().decode())['talents']
+			self.talents_data = self.transport.get_json(self._get_data_with_field_url("talents"))['talents']
 
 			return self.talents_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -1094,11 +1240,13 @@ class WoWCharacter:
 	"""Return self.characterName's titles data, decoded from json."""
 	def get_titles_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("titles")) as url:
-				self.titles_data = json.loads(url.read().decode())['titles']
+			self.titles_data = self.transport.get_json(self._get_data_with_field_url("titles"))['titles']
 
 			return self.titles_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -1131,7 +1279,7 @@ class WoWGuild:
 	   self.locale: String locale of the region.
 	   self.guild_name: String name of the guild to be searched.
 	   self.realm: String name of the realm the guild is on. """
-	def __init__(self, api_key, guild_name, realm, locale="en_US", token=None):
+	def __init__(self, api_key, guild_name, realm, locale="en_US", token=None, transport=None):
 		# Check if the user-given locale is supported, i.e. is one of Blizzard's regions.
 		if locale not in accepted_locales:
 			raise ValueError("Not supported locale.")
@@ -1150,6 +1298,7 @@ class WoWGuild:
 		# 	self.root = "https://tw.api.battle.net"
 
 		self.api_key = api_key
+		self.transport = transport if transport is not None else get_default_transport()
 		self.locale = locale
 
 		self.guild_name = guild_name
@@ -1162,6 +1311,16 @@ class WoWGuild:
 		self.news_data = []
 		self.challenge_data = []
 
+		# High-water mark of the news feed for get_new_guild_news(), when it isn't given a NewsCursor.
+		self.news_cursor = NewsCursor()
+
+		# Roster of the last call of get_roster_changes(), when it is not stored in a file.
+		self.previous_members = None
+
+		# Indexes of self.members_data, rebuilt whenever it is replaced (see _get_member_index()).
+		self._member_index = None
+		self._indexed_members = None
+
 
 	# The following are API request functions. Returns the URL that contains the JSON data fetched
 	# from Blizzard's API.
@@ -1200,11 +1359,13 @@ class WoWGuild:
 	"""."""
 	def get_guild_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_url()) as url:
-				self.guild_data = json.loads(url.read().decode())
+			self.guild_data = self.transport.get_json(self._get_data_url())
 
 			return self.guild_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -1228,59 +1389,124 @@ class WoWGuild:
 	"""."""
 	def get_members_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("members")) as url:
-				self.members_data = json.loads(url.read().decode())['members']
+			self.members_data = self.transport.get_json(self._get_data_with_field_url("members"))['members']
 
 			return self.members_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
 
-	"""."""
-	def get_member_info(self, member_name):
+	"""Retrieve the roster (see get_members_data()) if it wasn't yet."""
+	def _load_members(self):
 		if not self.members_data:
 			members_data = self.get_members_data()
 
-		return next((member for member in self.members_data if member['character']['name'].lower() == member_name.lower()), None)
+
+	"""Return the roster as a pandas dataframe, with one row per member and the columns name, realm, class, race,
+	   level, spec, role, achievementPoints and rank. Low-cardinality columns (realm, class, race, spec, role) are
+	   categorical, with class and race names (see int_to_class and int_to_race), and numeric columns are narrow
+	   unsigned integers. The class, race, spec and role columns have the same categories for every guild (see
+	   class_dtype, race_dtype, spec_dtype and role_dtype), so that they stay categorical when the rosters of many
+	   guilds are concatenated with pd.concat(); realm only does if the guilds are on the same realm.
+	   Members without a spec have a missing spec and role."""
+	def get_members_df(self):
+		self._load_members()
+
+		columns = {'name': [], 'realm': [], 'class': [], 'race': [], 'level': [], 'spec': [], 'role': [],
+			'achievementPoints': [], 'rank': []}
+
+		for member in self.members_data:
+			character = member['character']
+			spec = character.get('spec')
+
+			columns['name'].append(character['name'])
+			columns['realm'].append(character['realm'])
+			columns['class'].append(int_to_class.get(str(character['class'])))
+			columns['race'].append(int_to_race.get(str(character['race'])))
+			columns['level'].append(character['level'])
+			columns['spec'].append(spec['name'] if spec is not None else None)
+			columns['role'].append(spec['role'].upper() if spec is not None else None)
+			columns['achievementPoints'].append(character['achievementPoints'])
+			columns['rank'].append(member['rank'])
+
+		# Spec names that aren't in spec_dtype (e.g. localized names) extend its categories rather than being lost.
+		unknown_specs = sorted(set(columns['spec']) - set(spec_dtype.categories) - {None})
+		spec_categories = spec_dtype if not unknown_specs else pd.CategoricalDtype(list(spec_dtype.categories) + unknown_specs)
+
+		return pd.DataFrame({'name': columns['name'],
+			'realm': pd.Categorical(columns['realm']),
+			'class': pd.Categorical(columns['class'], dtype=class_dtype),
+			'race': pd.Categorical(columns['race'], dtype=race_dtype),
+			'level': pd.Series(columns['level'], dtype='uint8'),
+			'spec': pd.Categorical(columns['spec'], dtype=spec_categories),
+			'role': pd.Categorical(columns['role'], dtype=role_dtype),
+			'achievementPoints': pd.Series(columns['achievementPoints'], dtype='uint32'),
+			'rank': pd.Series(columns['rank'], dtype='uint8')})
+
+
+	"""Return the indexes of the roster, built once per roster fetch: a dictionary with the keys "name" (case-folded
+	   member name -> member), "rank" (rank -> list of members), "spec" (case-folded spec name -> list of members),
+	   and "role" (role, e.g. "HEALING" -> list of members). Fetches the roster first if it wasn't yet."""
+	def _get_member_index(self):
+		self._load_members()
+
+		if self._member_index is None or self._indexed_members is not self.members_data:
+			index = {'name': {}, 'rank': {}, 'spec': {}, 'role': {}}
+
+			for member in self.members_data:
+				character = member['character']
+
+				index['name'].setdefault(character['name'].casefold(), member)
+				index['rank'].setdefault(member['rank'], []).append(member)
+
+				if 'spec' in character:
+					index['spec'].setdefault(character['spec']['name'].casefold(), []).append(member)
+					index['role'].setdefault(character['spec']['role'].upper(), []).append(member)
+
+			self._member_index = index
+			self._indexed_members = self.members_data
+
+		return self._member_index
+
+
+	"""."""
+	def get_member_info(self, member_name):
+		return self._get_member_index()['name'].get(member_name.casefold())
 
 
 	"""."""
 	def get_member_rank(self, member_name):
-		if not self.members_data:
-			members_data = self.get_members_data()
+		member = self._get_member_index()['name'].get(member_name.casefold())
 
-		return next((member['rank'] for member in self.members_data if member['character']['name'] == member_name), None)
+		return member['rank'] if member is not None else None
 
 
 	"""."""
 	def get_num_members(self):
-		if not self.members_data:
-			members_data = self.get_members_data()
+		self._load_members()
 
 		return len(self.members_data)
 
 
 	"""."""
 	def get_members_names(self):
-		if not self.members_data:
-			members_data = self.get_members_data()
+		self._load_members()
 
 		return [member['character']['name'] for member in self.members_data]
 
 
 	"""."""
 	def get_members_by_spec(self, spec, as_names=False):
-		if not self.members_data:
-			members_data = self.get_members_data()
+		filtered_members = self._get_member_index()['spec'].get(spec.casefold(), [])
 
 		if as_names:
-			filtered_members = [member['character']['name'] for member in self.members_data if 'spec' in member['character'].keys() and member['character']['spec']['name'].lower() == spec.lower()]
-
-		else:
-			filtered_members = [member for member in self.members_data if 'spec' in member['character'].keys() and member['character']['spec']['name'].lower() == spec.lower()]
+			return [member['character']['name'] for member in filtered_members]
 
-		return filtered_members
+		return list(filtered_members)
 
 
 	"""."""
@@ -1290,18 +1516,12 @@ class WoWGuild:
 			return
 
 		role_map = {'dps': 'DPS', 'healer': 'HEALING', 'tank': 'TANK'}
-		role = role_map[role.lower()]
-
-		if not self.members_data:
-			members_data = self.get_members_data()
+		filtered_members = self._get_member_index()['role'].get(role_map[role.lower()], [])
 
 		if as_names:
-			filtered_members = [member['character']['name'] for member in self.members_data if 'spec' in member['character'].keys() and member['character']['spec']['role'].lower() == role.lower()]
+			return [member['character']['name'] for member in filtered_members]
 
-		else:
-			filtered_members = [member for member in self.members_data if 'spec' in member['character'].keys() and member['character']['spec']['role'].lower() == role.lower()]
-
-		return filtered_members
+		return list(filtered_members)
 
 
 	"""."""
@@ -1310,16 +1530,65 @@ class WoWGuild:
 			raise ValueError("Rank must be an integer.")
 			return
 
+		filtered_members = self._get_member_index()['rank'].get(rank, [])
+
+		if names:
+			return [member['character']['name'] for member in filtered_members]
+
+		return list(filtered_members)
+
+
+	"""Return a dictionary of (name, realm) -> member of the roster, with each character only once."""
+	def _get_unique_members(self):
+		members = {}
+
+		for member in self.members_data:
+			members.setdefault((member['character']['name'], member['character']['realm']), member)
+
+		return members
+
+
+	"""Fetch the WoWCharacter of every member of the roster concurrently, with at most MAX_CONCURRENCY requests in
+	   flight, through the transport (and so the rate limiter) of this object. Each character is fetched once, with
+	   prefetch(FIELDS), or with get_character_data() if FIELDS is None. See WoWCharacter.fetch_many().
+
+	   Yields (member, character, error) tuples in the order the requests complete, where MEMBER is the roster entry
+	   of the character, CHARACTER its WoWCharacter, and ERROR None, or the exception raised while fetching it."""
+	def enrich_members(self, fields=None, max_concurrency=8):
 		if not self.members_data:
 			members_data = self.get_members_data()
 
-		if names:
-			filtered_members = [member['character']['name'] for member in self.members_data if member['rank'] == rank]
+		members = self._get_unique_members()
+
+		for character, error in WoWCharacter.fetch_many(self.api_key, members, fields, self.locale, max_concurrency,
+			transport=self.transport):
+			yield members[(character.characterName, character.realm)], character, error
+
+
+	"""Retrieve the roster (see get_members_data()), and return its changes since the roster of the previous call: members
+	   who joined or left, and members whose rank, level or spec changed. See blizzpy.roster.diff_rosters().
+
+	   If PATH is given, the previous roster is read from the json file at PATH, and the new roster is stored there
+	   for the next call, e.g. of the next run of a nightly job. Otherwise, it is kept in self.previous_members.
+	   On the first call, every member is reported as joined."""
+	def get_roster_changes(self, path=None):
+		members_data = self.get_members_data()
+
+		return self._track_roster(path)
+
+
+	"""Return the changes of self.members_data since the previous roster, and store it as the previous roster.
+	   See get_roster_changes()."""
+	def _track_roster(self, path=None):
+		if path is not None:
+			previous = load_roster(path)
+			save_roster(path, self.members_data)
 
 		else:
-			filtered_members = [member for member in self.members_data if member['rank'] == rank]
+			previous = self.previous_members if self.previous_members is not None else []
+			self.previous_members = self.members_data
 
-		return filtered_members	
+		return diff_rosters(previous, self.members_data)
 
 
 ### Retrieving guild achievements data. ###
@@ -1327,11 +1596,13 @@ class WoWGuild:
 	"""."""
 	def get_achievements_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("achievements")) as url:
-				self.ach_data = json.loads(url.read().decode())['achievements']
+			self.ach_data = self.transport.get_json(self._get_data_with_field_url("achievements"))['achievements']
 
 			return self.ach_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -1353,26 +1624,39 @@ class WoWGuild:
 	"""."""
 	def get_guild_news_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("news")) as url:
-				self.news_data = json.loads(url.read().decode())['news']
+			self.news_data = self.transport.get_json(self._get_data_with_field_url("news"))['news']
 
 			return self.news_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
 
 
+	"""Retrieve the news feed (see get_guild_news_data()), and return the list of its entries that are newer than the
+	   entries returned by the previous calls, oldest first. The newest entry seen is kept in CURSOR, a NewsCursor
+	   that can be shared by many guilds and kept in a file, or in self.news_cursor if CURSOR is None."""
+	def get_new_guild_news(self, cursor=None):
+		news_data = self.get_guild_news_data()
+
+		return (cursor if cursor is not None else self.news_cursor).new_entries(guild_key(self.guild_name, self.realm), self.news_data)
+
+
 ### Retrieving guild challenges data. ###
 
 	"""."""
 	def get_guild_challenge_data(self):
 		try:
-			with urllib.request.urlopen(self._get_data_with_field_url("challenge")) as url:
-				self.challenge_data = json.loads(url.read().decode())['challenge']
+			self.challenge_data = self.transport.get_json(self._get_data_with_field_url("challenge"))['challenge']
 
 			return self.challenge_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key, character name, or realm name.")
 			return
@@ -1405,11 +1689,23 @@ class WoWGuild:
 			return
 
 
+"""Yield the auctions of the auction data file at PATH (e.g. written by WoWAuction.download_auction_data()) one at a
+   time, parsed from a memory-mapped view of the file."""
+def iter_auction_dump(path):
+	for auction in iter_json_array_file(path, 'auctions'):
+		yield auction
+
+
+"""Return the list of the auctions of the auction data file at PATH. See iter_auction_dump()."""
+def load_auction_dump(path):
+	return list(iter_auction_dump(path))
+
+
 #
 class WoWAuction:
 
 
-	def __init__(self, api_key, realm, locale="en_US", token=None):
+	def __init__(self, api_key, realm, locale="en_US", token=None, transport=None):
 		# Check if the user-given locale is supported, i.e. is one of Blizzard's regions.
 		if locale not in accepted_locales:
 			raise ValueError("Not supported locale.")
@@ -1429,10 +1725,15 @@ class WoWAuction:
 
 		self.realm = realm
 		self.api_key = api_key
+		self.transport = transport if transport is not None else get_default_transport()
 		self.locale = locale
 
 		self.last_modified = 0
 		self.auction_data = []
+		self.snapshot = None
+
+		# The list of auction dictionaries self.snapshot was built from, if any (see _get_auctions()).
+		self._snapshot_auctions = None
 
 
 	"""."""
@@ -1449,17 +1750,138 @@ class WoWAuction:
 
 ### Retrieving WoW auction house patch data. ###
 
-	"""."""
-	def get_auction_data(self):
+	"""Return the list of the auctions of the realm.
+
+	   If DUMP_PATH is given, the auction data file is streamed to a file at DUMP_PATH (see download_auction_data())
+	   and parsed from a memory-mapped view of it, instead of being read and decoded in memory as a whole.
+	   The file can be parsed again later without the API with load_auction_dump()."""
+	def get_auction_data(self, dump_path=None):
+		if dump_path is not None:
+			self.download_auction_data(dump_path)
+
+			self.auction_data = load_auction_dump(dump_path)
+			self.snapshot = None
+			self._snapshot_auctions = None
+
+			return self.auction_data
+
 		try:
-			with urllib.request.urlopen(self._get_auction_data_url()) as url1:
-				raw_data = json.loads(url1.read().decode())
-				self.last_modified = raw_data['files'][0]['lastModified']
+			raw_data = self.transport.get_json(self._get_auction_data_url())
+			self.last_modified = raw_data['files'][0]['lastModified']
 
-			with urllib.request.urlopen(raw_data['files'][0]['url']) as url2:
-				self.auction_data = json.loads(url2.read().decode())['auctions']
+			self.auction_data = self.transport.get_json(raw_data['files'][0]['url'])['auctions']
+			self.snapshot = None
+			self._snapshot_auctions = None
 
 			return self.auction_data
+		except BlizzardAPIError:
+			raise
+
+		except:
+			raise ValueError("Could not retrieve data. Please check your API key or realm.")
+			return
+
+
+	"""Yield the auctions of the realm one at a time, parsed while the auction file downloads, so that filters and
+	   aggregations run in constant memory instead of holding the whole file. Does not change self.auction_data."""
+	def iter_auctions(self):
+		try:
+			raw_data = self.transport.get_json(self._get_auction_data_url())
+			self.last_modified = raw_data['files'][0]['lastModified']
+
+			url = raw_data['files'][0]['url']
+		except BlizzardAPIError:
+			raise
+
+		except:
+			raise ValueError("Could not retrieve data. Please check your API key or realm.")
+			return
+
+		for auction in iter_json_array(self.transport.stream(url), 'auctions'):
+			yield auction
+
+
+	"""Download the auction data file of the realm to PATH, streamed to disk in chunks without holding it in memory,
+	   and return the lastModified timestamp of the auction data. PATH is only replaced once the download is complete."""
+	def download_auction_data(self, path):
+		try:
+			raw_data = self.transport.get_json(self._get_auction_data_url())
+			self.last_modified = raw_data['files'][0]['lastModified']
+
+			url = raw_data['files'][0]['url']
+		except BlizzardAPIError:
+			raise
+
+		except:
+			raise ValueError("Could not retrieve data. Please check your API key or realm.")
+			return
+
+		# Written atomically, so that a failed download never leaves a truncated file at PATH.
+		with atomic_write(path) as f:
+			for chunk in self.transport.stream(url):
+				f.write(chunk)
+
+		return self.last_modified
+
+
+	"""Return the auctions of the realm as an AuctionSnapshot, i.e. in NumPy arrays, streamed from the API without
+	   building the list of auction dictionaries."""
+	def get_snapshot(self):
+		self.snapshot = AuctionSnapshot.from_auctions(self.iter_auctions())
+		self.snapshot.last_modified = self.last_modified
+		self._snapshot_auctions = None
+
+		return self.snapshot
+
+
+	"""Retrieve a new snapshot of the auctions (see get_snapshot()), and return the AuctionDiff of the previous
+	   snapshot of this object and the new one, e.g. to track the sales of the realm between two auction dumps.
+	   If there was no previous snapshot, every auction of the new snapshot is reported as added."""
+	def get_snapshot_diff(self):
+		previous = self.snapshot if self.snapshot is not None else AuctionSnapshot.from_auctions([])
+
+		return self.get_snapshot().diff(previous)
+
+
+	"""Return the AuctionSnapshot the queries of this object run on: self.snapshot, or a snapshot of self.auction_data
+	   if get_auction_data() was called since. If no auction data was retrieved yet, retrieve a new snapshot, or the
+	   auction data (with get_auction_data()) if FULL, so that the dictionaries of the auctions keep every field."""
+	def _get_snapshot(self, full=False):
+		if self.snapshot is None:
+			if not self.auction_data:
+				if full:
+					self.get_auction_data()
+
+				else:
+					self.get_snapshot()
+
+			if self.snapshot is None:
+				self.snapshot = AuctionSnapshot.from_auctions(self.auction_data, self.last_modified)
+				self._snapshot_auctions = self.auction_data
+
+		return self.snapshot
+
+
+	"""Return the list of the dictionaries of the auctions at POSITIONS of self.snapshot: the dictionaries of
+	   self.auction_data, with every field the API sent (e.g. bonusLists, petSpeciesId, modifiers), if the snapshot was
+	   built from them, or dictionaries of the fields of the snapshot only (see AuctionSnapshot.get_auction()) otherwise."""
+	def _get_auctions(self, positions):
+		if self._snapshot_auctions is not None:
+			return [self._snapshot_auctions[i] for i in positions.tolist()]
+
+		return [self.snapshot.get_auction(i) for i in positions]
+
+
+	"""Return the lastModified timestamp of the latest auction data of the realm, without downloading the auction data
+	   itself, e.g. to only call get_snapshot() when it changed."""
+	def check_last_modified(self):
+		try:
+			raw_data = self.transport.get_json(self._get_auction_data_url())
+
+			return raw_data['files'][0]['lastModified']
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or realm.")
 			return
@@ -1475,29 +1897,37 @@ class WoWAuction:
 
 	"""."""
 	def get_buyout_prices(self, item_id, in_gold=False):
-		if not self.auction_data:
-			auction_data = self.get_auction_data()
-
-		if in_gold:
-			return {round(auction['buyout']/10000, 4):auction['quantity'] for auction in self.auction_data if auction['item'] == item_id}
-
-		else:
-			return {auction['buyout']:auction['quantity'] for auction in self.auction_data if auction['item'] == item_id}
+		return self._get_snapshot().get_buyout_prices(item_id, in_gold)
 
 
 	"""."""
 	def get_auctions_by_player(self, player_name):
-		if not self.auction_data:
-			auction_data = self.get_auction_data()
+		return self._get_auctions(self._get_snapshot(full=True).get_player_positions(player_name))
 
-		return [auction for auction in self.auction_data if auction['owner'] == player_name]
+
+	"""Return the list of the dictionaries of every auction of ITEM_ID."""
+	def get_auctions_by_item(self, item_id):
+		return self._get_auctions(self._get_snapshot(full=True).get_item_positions(item_id))
+
+
+	"""Return a dictionary of item id -> list of the dictionaries of the K cheapest auctions of the item, for every
+	   item id of ITEM_IDS, with the same keys as get_auctions_by_item(). See AuctionSnapshot.get_cheapest_positions()."""
+	def cheapest(self, item_ids, k=5, by="unit"):
+		cheapest = self._get_snapshot(full=True).get_cheapest_positions(item_ids, k, by)
+
+		return {item_id: self._get_auctions(positions) for item_id, positions in cheapest.items()}
+
+
+	"""Return a pandas DataFrame of the market statistics of every item of the realm. See AuctionSnapshot.market_summary()."""
+	def market_summary(self, percentiles=(10, 25, 75, 90), in_gold=False):
+		return self._get_snapshot().market_summary(percentiles, in_gold)
 
 
 #
 class WoWPets:
 
 	"""."""
-	def __init__(self, api_key, locale="en_US", token=None):
+	def __init__(self, api_key, locale="en_US", token=None, transport=None):
 		# Check if the user-given locale is supported, i.e. is one of Blizzard's regions.
 		if locale not in accepted_locales:
 			raise ValueError("Not supported locale.")
@@ -1516,6 +1946,7 @@ class WoWPets:
 		# 	self.root = "https://tw.api.battle.net"
 
 		self.api_key = api_key
+		self.transport = transport if transport is not None else get_default_transport()
 		self.locale = locale
 
 		self.master_data = []
@@ -1579,11 +2010,13 @@ class WoWPets:
 	"""."""
 	def get_master_list(self):
 		try:
-			with urllib.request.urlopen(self._get_master_data_url()) as url:
-				self.master_data = json.loads(url.read().decode())['pets']
+			self.master_data = self.transport.get_json(self._get_master_data_url())['pets']
 
 			return self.master_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key.")
 			return
@@ -1658,11 +2091,13 @@ class WoWPets:
 	"""."""
 	def get_ability_data(self, abilityId):
 		try:
-			with urllib.request.urlopen(self._get_ability_data_url(abilityId)) as url:
-				self.ability_data = json.loads(url.read().decode())
+			self.ability_data = self.transport.get_json(self._get_ability_data_url(abilityId))
 
 			return self.ability_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or ability ID.")
 			return
@@ -1673,11 +2108,13 @@ class WoWPets:
 	"""."""
 	def get_species_data(self, speciesId):
 		try:
-			with urllib.request.urlopen(self._get_species_data_url(speciesId)) as url:
-				self.species_data = json.loads(url.read().decode())
+			self.species_data = self.transport.get_json(self._get_species_data_url(speciesId))
 
 			return self.species_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or ability ID.")
 			return
@@ -1688,11 +2125,13 @@ class WoWPets:
 	"""."""
 	def get_species_stats_data(self, speciesId, level=1, breedId=3, qualityId=1):
 		try:
-			with urllib.request.urlopen(self._get_stats_data_url(speciesId, level, breedId, qualityId)) as url:
-				self.ability_data = json.loads(url.read().decode())
+			self.ability_data = self.transport.get_json(self._get_stats_data_url(speciesId, level, breedId, qualityId))
 
 			return self.ability_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or ability ID.")
 			return
@@ -1702,7 +2141,7 @@ class WoWPets:
 class WoWPVP:
 
 	"""."""
-	def __init__(self, api_key, locale="en_US", token=None):
+	def __init__(self, api_key, locale="en_US", token=None, transport=None):
 		# Check if the user-given locale is supported, i.e. is one of Blizzard's regions.
 		if locale not in accepted_locales:
 			raise ValueError("Not supported locale.")
@@ -1721,6 +2160,7 @@ class WoWPVP:
 		# 	self.root = "https://tw.api.battle.net"
 
 		self.api_key = api_key
+		self.transport = transport if transport is not None else get_default_transport()
 		self.locale = locale
 
 		self.pvp_2v2_data = {}
@@ -1747,11 +2187,13 @@ class WoWPVP:
 	"""."""
 	def get_2v2_data(self):
 		try:
-			with urllib.request.urlopen(self._get_pvp_data_url("2v2")) as url:
-				self.pvp_2v2_data = json.loads(url.read().decode())
+			self.pvp_2v2_data = self.transport.get_json(self._get_pvp_data_url("2v2"))
 
 			return self.pvp_2v2_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or Achievement ID.")
 			return
@@ -1782,11 +2224,13 @@ class WoWPVP:
 	"""."""
 	def get_3v3_data(self):
 		try:
-			with urllib.request.urlopen(self._get_pvp_data_url("3v3")) as url:
-				self.pvp_3v3_data = json.loads(url.read().decode())
+			self.pvp_3v3_data = self.transport.get_json(self._get_pvp_data_url("3v3"))
 
 			return self.pvp_3v3_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or Achievement ID.")
 			return
@@ -1816,11 +2260,13 @@ class WoWPVP:
 	"""."""
 	def get_rbg_data(self):
 		try:
-			with urllib.request.urlopen(self._get_pvp_data_url("rbg")) as url:
-				self.pvp_rbg_data = json.loads(url.read().decode())
+			self.pvp_rbg_data = self.transport.get_json(self._get_pvp_data_url("rbg"))
 
 			return self.pvp_rbg_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or Achievement ID.")
 			return
@@ -1846,7 +2292,7 @@ class WoWPVP:
 class WoWResources:
 
 	"""."""
-	def __init__(self, api_key, locale="en_US", token=None):
+	def __init__(self, api_key, locale="en_US", token=None, transport=None):
 		# Check if the user-given locale is supported, i.e. is one of Blizzard's regions.
 		if locale not in accepted_locales:
 			raise ValueError("Not supported locale.")
@@ -1865,6 +2311,7 @@ class WoWResources:
 		# 	self.root = "https://tw.api.battle.net"
 
 		self.api_key = api_key
+		self.transport = transport if transport is not None else get_default_transport()
 		self.locale = locale
 
 		self.achievements_data = {}
@@ -2039,11 +2486,13 @@ class WoWResources:
 	"""."""
 	def get_achievement_data(self, achievement_id):
 		try:
-			with urllib.request.urlopen(self._get_achievement_data_url(achievement_id)) as url:
-				self.achievement_data = json.loads(url.read().decode())
+			self.achievement_data = self.transport.get_json(self._get_achievement_data_url(achievement_id))
 
 			return self.achievement_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or Achievement ID.")
 			return
@@ -2054,11 +2503,13 @@ class WoWResources:
 	"""."""
 	def get_bosses_data(self):
 		try:
-			with urllib.request.urlopen(self._get_boss_master_url()) as url:
-				self.bosses_data = json.loads(url.read().decode())
+			self.bosses_data = self.transport.get_json(self._get_boss_master_url())
 
 			return self.bosses_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key.")
 			return
@@ -2067,11 +2518,13 @@ class WoWResources:
 	"""."""
 	def get_boss_info(self, boss_id):
 		try:
-			with urllib.request.urlopen(self._get_boss_data_url(boss_id)) as url:
-				self.boss_data = json.loads(url.read().decode())
+			self.boss_data = self.transport.get_json(self._get_boss_data_url(boss_id))
 
 			return self.boss_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or Boss ID.")
 			return
@@ -2082,11 +2535,13 @@ class WoWResources:
 	"""."""
 	def get_item_data(self, item_id):
 		try:
-			with urllib.request.urlopen(self._get_item_data_url(item_id)) as url:
-				self.item_data = json.loads(url.read().decode())
+			self.item_data = self.transport.get_json(self._get_item_data_url(item_id))
 
 			return self.item_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or Boss ID.")
 			return
@@ -2095,11 +2550,13 @@ class WoWResources:
 	"""."""
 	def get_item_set_data(self, itemSet_id):
 		try:
-			with urllib.request.urlopen(self._get_item_set_data_url(set_id)) as url:
-				self.item_set_data = json.loads(url.read().decode())
+			self.item_set_data = self.transport.get_json(self._get_item_set_data_url(set_id))
 
 			return self.item_set_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or Boss ID.")
 			return
@@ -2110,11 +2567,13 @@ class WoWResources:
 	"""."""
 	def get_mounts_data(self):
 		try:
-			with urllib.request.urlopen(self._get_mount_master_url()) as url:
-				self.mounts_data = json.loads(url.read().decode())
+			self.mounts_data = self.transport.get_json(self._get_mount_master_url())
 
 			return self.mounts_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or Boss ID.")
 			return
@@ -2125,11 +2584,13 @@ class WoWResources:
 	"""."""
 	def get_quest_data(self, quest_id):
 		try:
-			with urllib.request.urlopen(self._get_quest_data_url(quest_id)) as url:
-				self.quest_data = json.loads(url.read().decode())
+			self.quest_data = self.transport.get_json(self._get_quest_data_url(quest_id))
 
 			return self.quest_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or Boss ID.")
 			return
@@ -2140,11 +2601,13 @@ class WoWResources:
 	"""."""
 	def get_realms_data(self):
 		try:
-			with urllib.request.urlopen(self._get_realms_data_url()) as url:
-				self.realms_data = json.loads(url.read().decode())
+			self.realms_data = self.transport.get_json(self._get_realms_data_url())
 
 			return self.realms_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or Boss ID.")
 			return
@@ -2155,11 +2618,13 @@ class WoWResources:
 	"""."""
 	def get_recipe_data(self, recipe_id):
 		try:
-			with urllib.request.urlopen(self._get_recipe_data_url(recipe_id)) as url:
-				self.recipe_data = json.loads(url.read().decode())
+			self.recipe_data = self.transport.get_json(self._get_recipe_data_url(recipe_id))
 
 			return self.recipe_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or Boss ID.")
 			return
@@ -2170,11 +2635,13 @@ class WoWResources:
 	"""."""
 	def get_spell_data(self, spell_id):
 		try:
-			with urllib.request.urlopen(self._get_spell_data_url(spell_id)) as url:
-				self.spell_data = json.loads(url.read().decode())
+			self.spell_data = self.transport.get_json(self._get_spell_data_url(spell_id))
 
 			return self.spell_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or Boss ID.")
 			return
@@ -2185,11 +2652,13 @@ class WoWResources:
 	"""."""
 	def get_zones_data(self):
 		try:
-			with urllib.request.urlopen(self._get_zone_master_url()) as url:
-				self.zones_data = json.loads(url.read().decode())
+			self.zones_data = self.transport.get_json(self._get_zone_master_url())
 
 			return self.zones_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or Boss ID.")
 			return
@@ -2198,11 +2667,13 @@ class WoWResources:
 	"""."""
 	def get_zone_info(self, zone_id):
 		try:
-			with urllib.request.urlopen(self._get_zone_data_url(zone_id)) as url:
-				self.zone_data = json.loads(url.read().decode())
+			self.zone_data = self.transport.get_json(self._get_zone_data_url(zone_id))
 
 			return self.zone_data
 
+		except BlizzardAPIError:
+			raise
+
 		except:
 			raise ValueError("Could not retrieve data. Please check your API key or Boss ID.")
 			return
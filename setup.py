@@ -29,7 +29,12 @@ setup(
 	],
 	packages=['blizzpy'],
 	install_requires=[
-	'pandas>=0.23.0'
-	]
+	'numpy>=1.15.0',
+	'pandas>=0.23.0',
+	'requests>=2.18.0'
+	],
+	extras_require={
+	'async': ['aiohttp>=3.0']
+	}
 	)
 
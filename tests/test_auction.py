@@ -0,0 +1,107 @@
+##################################################
+# Tests of AuctionDiff, against a plain dict     #
+# comparison of the same auctions.               #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import random
+import unittest
+
+from blizzpy.auction import AuctionSnapshot, time_left_levels
+
+
+"""Return an auction dictionary with the id AUC."""
+def make_auction(auc, item=82800, bid=100, time_left="LONG", owner="Shinela"):
+	return {'auc': auc, 'item': item, 'owner': owner, 'ownerRealm': "Proudmoore", 'bid': bid, 'buyout': bid * 2,
+		'quantity': 1, 'timeLeft': time_left}
+
+
+#
+class AuctionDiffTest(unittest.TestCase):
+
+	def test_matches_dict_comparison(self):
+		rng = random.Random(42)
+
+		for _ in range(20):
+			old = {auc: make_auction(auc, rng.randrange(10), rng.randrange(1, 5), rng.choice(time_left_levels))
+				for auc in rng.sample(range(1000), 200)}
+			new = {}
+
+			for auc in rng.sample(range(1000), 200):
+				auction = dict(old.get(auc, make_auction(auc, rng.randrange(10))))
+
+				if rng.random() < 0.2:
+					auction['bid'] += 1
+
+				if rng.random() < 0.2:
+					auction['timeLeft'] = rng.choice(time_left_levels)
+
+				new[auc] = auction
+
+			# Auctions in a shuffled order, since the API doesn't sort them.
+			old_auctions, new_auctions = list(old.values()), list(new.values())
+			rng.shuffle(old_auctions)
+			rng.shuffle(new_auctions)
+
+			diff = AuctionSnapshot.from_auctions(new_auctions, 3600 * 1000).diff(AuctionSnapshot.from_auctions(old_auctions, 0))
+			common = old.keys() & new.keys()
+
+			self.assertEqual(set(diff.get_added().auc.tolist()), new.keys() - old.keys())
+			self.assertEqual(set(diff.get_removed().auc.tolist()), old.keys() - new.keys())
+			self.assertEqual(set(diff.get_changed()['auc'].tolist()),
+				{auc for auc in common if old[auc]['bid'] != new[auc]['bid'] or old[auc]['timeLeft'] != new[auc]['timeLeft']})
+
+			# One hour elapsed: removed LONG and VERY_LONG auctions had time left, so they were sold.
+			self.assertEqual(set(diff.get_sold().auc.tolist()),
+				{auc for auc in old.keys() - new.keys() if old[auc]['timeLeft'] in ("LONG", "VERY_LONG")})
+			self.assertEqual(set(diff.get_expired().auc.tolist()),
+				{auc for auc in old.keys() - new.keys() if old[auc]['timeLeft'] in ("SHORT", "MEDIUM")})
+
+
+	def test_sold_or_expired_depends_on_elapsed_time(self):
+		old = AuctionSnapshot.from_auctions([make_auction(1, time_left="MEDIUM"), make_auction(2, time_left="LONG"),
+			make_auction(3, time_left="VERY_LONG")], 0)
+
+		# 10 minutes later: every removed auction still had at least 30 minutes left.
+		self.assertEqual(AuctionSnapshot.from_auctions([], 10 * 60 * 1000).diff(old).summary()['sold'], 3)
+
+		# 90 minutes later: MEDIUM auctions may have expired, LONG ones still had at least 2 hours left.
+		diff = AuctionSnapshot.from_auctions([], 90 * 60 * 1000).diff(old)
+		self.assertEqual(diff.get_expired().auc.tolist(), [1])
+		self.assertEqual(sorted(diff.get_sold().auc.tolist()), [2, 3])
+
+		# 13 hours later: every removed auction may have expired.
+		self.assertEqual(AuctionSnapshot.from_auctions([], 13 * 3600 * 1000).diff(old).summary()['expired'], 3)
+
+
+	def test_unknown_time_left_is_expired(self):
+		old = AuctionSnapshot.from_auctions([make_auction(1, time_left="UNKNOWN")], 0)
+		diff = AuctionSnapshot.from_auctions([], 1000).diff(old)
+
+		self.assertEqual(diff.summary()['expired'], 1)
+
+
+	def test_changed_columns(self):
+		old = AuctionSnapshot.from_auctions([make_auction(1, bid=100, time_left="LONG"), make_auction(2)], 0)
+		new = AuctionSnapshot.from_auctions([make_auction(2), make_auction(1, bid=150, time_left="MEDIUM")], 1000)
+		changed = new.diff(old).get_changed()
+
+		self.assertEqual(changed['auc'].tolist(), [1])
+		self.assertEqual(changed['old_bid'].tolist(), [100])
+		self.assertEqual(changed['new_bid'].tolist(), [150])
+		self.assertEqual(changed['old_timeLeft'].tolist(), ["LONG"])
+		self.assertEqual(changed['new_timeLeft'].tolist(), ["MEDIUM"])
+
+
+	def test_empty_snapshots(self):
+		new = AuctionSnapshot.from_auctions([make_auction(1), make_auction(2)], 1000)
+
+		self.assertEqual(new.diff(AuctionSnapshot.from_auctions([])).summary(), {'added': 2, 'removed': 0, 'sold': 0,
+			'expired': 0, 'bid_changed': 0, 'time_left_changed': 0})
+		self.assertEqual(AuctionSnapshot.from_auctions([]).diff(new).summary()['removed'], 2)
+
+
+if __name__ == '__main__':
+	unittest.main()
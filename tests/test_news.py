@@ -0,0 +1,109 @@
+##################################################
+# Tests of NewsCursor high-water marks, including #
+# entries that share a timestamp.                #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from blizzpy.news import NewsCursor, guild_key
+
+
+"""Return a news entry of CHARACTER at TIMESTAMP, e.g. looting ITEM_ID."""
+def make_entry(timestamp, character="Xfitvegan", item_id=None, entry_type="itemLoot"):
+	entry = {'type': entry_type, 'character': character, 'timestamp': timestamp}
+
+	if item_id is not None:
+		entry['itemId'] = item_id
+
+	return entry
+
+
+#
+class NewsCursorTest(unittest.TestCase):
+
+	def setUp(self):
+		self.key = guild_key("Method", "Tarren Mill")
+
+
+	def test_first_call_returns_every_entry_oldest_first(self):
+		news = [make_entry(3), make_entry(1), make_entry(2)]
+
+		self.assertEqual([entry['timestamp'] for entry in NewsCursor().new_entries(self.key, news)], [1, 2, 3])
+
+
+	def test_only_newer_entries_are_returned(self):
+		cursor = NewsCursor()
+		cursor.new_entries(self.key, [make_entry(1), make_entry(2)])
+
+		self.assertEqual(cursor.new_entries(self.key, [make_entry(1), make_entry(2)]), [])
+		self.assertEqual(cursor.new_entries(self.key, [make_entry(3), make_entry(2), make_entry(1)]), [make_entry(3)])
+
+
+	def test_new_entry_with_the_newest_timestamp(self):
+		cursor = NewsCursor()
+		cursor.new_entries(self.key, [make_entry(1), make_entry(5, item_id=1)])
+
+		# Loot from the same boss, fetched after the first item: same timestamp, different entry.
+		news = [make_entry(1), make_entry(5, item_id=1), make_entry(5, item_id=2)]
+
+		self.assertEqual(cursor.new_entries(self.key, news), [make_entry(5, item_id=2)])
+		self.assertEqual(cursor.new_entries(self.key, news), [])
+
+
+	def test_ties_are_forgotten_once_a_newer_timestamp_is_seen(self):
+		cursor = NewsCursor()
+		cursor.new_entries(self.key, [make_entry(5, item_id=1), make_entry(5, item_id=2)])
+		cursor.new_entries(self.key, [make_entry(6)])
+
+		self.assertEqual(cursor.marks[self.key]['timestamp'], 6)
+		self.assertEqual(len(cursor.marks[self.key]['seen']), 1)
+
+		# Entries older than the high-water mark are never returned again.
+		self.assertEqual(cursor.new_entries(self.key, [make_entry(5, item_id=3), make_entry(6)]), [])
+
+
+	def test_entries_with_the_same_keys_in_another_order_are_the_same(self):
+		cursor = NewsCursor()
+		cursor.new_entries(self.key, [{'type': "playerAchievement", 'character': "Shinela", 'timestamp': 5}])
+
+		self.assertEqual(cursor.new_entries(self.key, [{'timestamp': 5, 'character': "Shinela", 'type': "playerAchievement"}]), [])
+
+
+	def test_guilds_have_separate_marks(self):
+		cursor = NewsCursor()
+		cursor.new_entries(self.key, [make_entry(5)])
+
+		self.assertEqual(cursor.new_entries(guild_key("Limit", "Illidan"), [make_entry(5)]), [make_entry(5)])
+
+
+	def test_guild_keys_ignore_case(self):
+		self.assertEqual(guild_key("METHOD", "tarren mill"), self.key)
+
+
+	def test_marks_survive_save_and_reload(self):
+		directory = tempfile.mkdtemp()
+
+		try:
+			path = os.path.join(directory, "news.json")
+			cursor = NewsCursor(path)
+			cursor.new_entries(self.key, [make_entry(5, item_id=1), make_entry(5, item_id=2)])
+			cursor.save()
+
+			reloaded = NewsCursor(path)
+			news = [make_entry(5, item_id=1), make_entry(5, item_id=2), make_entry(5, item_id=3)]
+
+			self.assertEqual(reloaded.new_entries(self.key, news), [make_entry(5, item_id=3)])
+			self.assertEqual(os.listdir(directory), ["news.json"])
+
+		finally:
+			shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+	unittest.main()
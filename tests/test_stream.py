@@ -0,0 +1,126 @@
+##################################################
+# Tests of the incremental json array parser,    #
+# with documents cut at every chunk boundary.    #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import json
+import os
+import tempfile
+import unittest
+
+from blizzpy.stream import JSONArrayParser, iter_json_array, iter_json_array_file
+
+
+# A small auction dump, with numbers, literals, nested arrays, strings with delimiters in them, and non-ASCII text.
+sample_dump = json.dumps({'realms': [{'name': "Proudmoore", 'slug': "proudmoore"}], 'auctions': [
+	{'auc': 1018912, 'item': 82800, 'owner': "Ñoño", 'ownerRealm': "Proudmoore", 'bid': 1234567, 'buyout': 1500000,
+		'quantity': 1, 'timeLeft': "LONG", 'rand': 0, 'seed': 0, 'context': 0, 'petSpeciesId': 39},
+	{'auc': 1018913, 'item': 124101, 'owner': "Shinela", 'ownerRealm': "Proudmoore", 'bid': 99, 'buyout': 0,
+		'quantity': 200, 'timeLeft': "VERY_LONG", 'bonusLists': [{'bonusListId': 1472}, {'bonusListId': -3}]},
+	12345, -0.5, 3.25e10, True, False, None, "a, string] with {delimiters}", [], {}, [1, [2, [3]]], "漢字", 7],
+	'after': [1, 2]}, ensure_ascii=False).encode('utf-8')
+
+expected = json.loads(sample_dump.decode('utf-8'))['auctions']
+
+
+"""Return the list of the elements of the array under KEY, parsed from CHUNKS by a single JSONArrayParser."""
+def parse_chunks(chunks, key='auctions'):
+	return list(iter_json_array(chunks, key))
+
+
+#
+class JSONArrayParserTest(unittest.TestCase):
+
+	def test_whole_document(self):
+		self.assertEqual(parse_chunks([sample_dump]), expected)
+
+
+	def test_split_at_every_byte_offset(self):
+		for offset in range(len(sample_dump) + 1):
+			self.assertEqual(parse_chunks([sample_dump[:offset], sample_dump[offset:]]), expected, offset)
+
+
+	def test_small_chunk_sizes(self):
+		for size in range(1, 17):
+			chunks = [sample_dump[start:start + size] for start in range(0, len(sample_dump), size)]
+
+			self.assertEqual(parse_chunks(chunks), expected, size)
+
+
+	def test_key_split_across_chunks(self):
+		start = sample_dump.index(b'"auctions"')
+
+		for offset in range(start, start + len(b'"auctions": [') + 1):
+			self.assertEqual(parse_chunks([sample_dump[:offset], sample_dump[offset:]]), expected, offset)
+
+
+	def test_number_at_end_of_buffer_is_deferred(self):
+		parser = JSONArrayParser('a')
+
+		self.assertEqual(parser.feed(b'{"a": [12'), [])
+		self.assertEqual(parser.feed(b'.5, 3'), [12.5])
+		self.assertEqual(parser.feed(b'4]}'), [34])
+		self.assertTrue(parser.done)
+		self.assertEqual(parser.close(), [])
+
+
+	def test_unclosed_array_raises_on_close(self):
+		parser = JSONArrayParser('a')
+
+		self.assertEqual(parser.feed(b'{"a": [1, 2'), [1])
+		self.assertRaises(ValueError, parser.close)
+
+
+	def test_truncated_documents(self):
+		# Every prefix that stops before the "]" closing the auctions array.
+		end = sample_dump.index(b', "after"')
+
+		for offset in range(end):
+			with self.assertRaises(ValueError, msg=offset):
+				parse_chunks([sample_dump[:offset]])
+
+
+	def test_missing_key(self):
+		with self.assertRaises(ValueError):
+			parse_chunks([b'{"realms": [1, 2]}'])
+
+
+	def test_other_key(self):
+		self.assertEqual(parse_chunks([sample_dump], 'after'), [1, 2])
+
+
+	def test_empty_array(self):
+		self.assertEqual(parse_chunks([b'{"auctions"', b': [ ', b' ]}']), [])
+
+
+	def test_file(self):
+		fd, path = tempfile.mkstemp(suffix=".json")
+
+		try:
+			with os.fdopen(fd, 'wb') as f:
+				f.write(sample_dump)
+
+			for chunk_size in (1, 7, 64, 1024 * 1024):
+				self.assertEqual(list(iter_json_array_file(path, 'auctions', chunk_size)), expected)
+
+		finally:
+			os.remove(path)
+
+
+	def test_empty_file(self):
+		fd, path = tempfile.mkstemp(suffix=".json")
+		os.close(fd)
+
+		try:
+			with self.assertRaises(ValueError):
+				list(iter_json_array_file(path, 'auctions'))
+
+		finally:
+			os.remove(path)
+
+
+if __name__ == '__main__':
+	unittest.main()
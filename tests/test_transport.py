@@ -0,0 +1,172 @@
+##################################################
+# Tests of the retries and circuit breakers of   #
+# Transport, against a local fault-injecting     #
+# HTTP server.                                   #
+# Part of BlizzPy.                               #
+#                                                #
+# Written by Lewis Kim.                          #
+##################################################
+
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from blizzpy.ratelimit import RateLimiter
+from blizzpy.retry import RetryPolicy
+from blizzpy.transport import Transport, ServiceUnavailableError, CircuitOpenError
+
+
+#
+class FaultHandler(BaseHTTPRequestHandler):
+
+	"""Answers each request with the next (status, headers) pair of self.server.faults, or with "200 OK" and a
+	   json body once there are none left, and counts the requests it received."""
+	def do_GET(self):
+		self.server.requests += 1
+		status, headers = self.server.faults.pop(0) if self.server.faults else (200, {})
+		body = json.dumps({'status': status}).encode()
+
+		self.send_response(status)
+
+		for name, value in headers.items():
+			self.send_header(name, value)
+
+		self.send_header("Content-Type", "application/json")
+		self.send_header("Content-Length", str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+
+
+	def log_message(self, *args):
+		pass
+
+
+#
+class TransportFaultTest(unittest.TestCase):
+
+	def setUp(self):
+		self.server = HTTPServer(("127.0.0.1", 0), FaultHandler)
+		self.server.faults = []
+		self.server.requests = 0
+		self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+		self.thread.start()
+
+		self.url = "http://127.0.0.1:{}/wow/realm/status".format(self.server.server_port)
+
+
+	def tearDown(self):
+		self.server.shutdown()
+		self.server.server_close()
+
+
+	"""Return a Transport without rate limiting, caching, or backoff delays."""
+	def make_transport(self, max_retries=3, failure_threshold=5, reset_timeout=30):
+		return Transport(rate_limiter=RateLimiter(per_second=None, per_hour=None),
+			retry=RetryPolicy(max_retries=max_retries, backoff=0, jitter=False),
+			failure_threshold=failure_threshold, reset_timeout=reset_timeout, conditional=False)
+
+
+	def test_retries_transient_errors(self):
+		self.server.faults = [(503, {}), (502, {}), (429, {})]
+
+		self.assertEqual(self.make_transport().get_json(self.url), {'status': 200})
+		self.assertEqual(self.server.requests, 4)
+
+
+	def test_raises_after_every_retry(self):
+		self.server.faults = [(503, {})] * 3
+
+		with self.assertRaises(ServiceUnavailableError):
+			self.make_transport(max_retries=2).get_json(self.url)
+
+		self.assertEqual(self.server.requests, 3)
+
+
+	def test_waits_for_retry_after_on_5xx(self):
+		self.server.faults = [(503, {"Retry-After": "1"})]
+
+		start = time.monotonic()
+		self.make_transport().get_json(self.url)
+
+		self.assertGreaterEqual(time.monotonic() - start, 1)
+		self.assertEqual(self.server.requests, 2)
+
+
+	def test_retry_after_is_kept_on_the_error(self):
+		self.server.faults = [(503, {"Retry-After": "7"})]
+
+		with self.assertRaises(ServiceUnavailableError) as context:
+			self.make_transport(max_retries=0).get_json(self.url)
+
+		self.assertEqual(context.exception.retry_after, 7)
+
+
+	def test_circuit_breaker_opens_half_opens_and_closes(self):
+		transport = self.make_transport(max_retries=0, failure_threshold=2, reset_timeout=0.5)
+		breaker = transport.get_circuit_breaker(self.url)
+		self.server.faults = [(503, {})] * 2
+
+		for _ in range(2):
+			with self.assertRaises(ServiceUnavailableError):
+				transport.get_json(self.url)
+
+		self.assertEqual(breaker.state(), "open")
+
+		# Fails fast, without sending the request.
+		with self.assertRaises(CircuitOpenError):
+			transport.get_json(self.url)
+
+		self.assertEqual(self.server.requests, 2)
+
+		time.sleep(0.5)
+		self.assertEqual(breaker.state(), "half-open")
+
+		self.assertEqual(transport.get_json(self.url), {'status': 200})
+		self.assertEqual(breaker.state(), "closed")
+
+
+	def test_failed_trial_reopens_the_circuit(self):
+		transport = self.make_transport(max_retries=0, failure_threshold=1, reset_timeout=0.5)
+		breaker = transport.get_circuit_breaker(self.url)
+		self.server.faults = [(503, {})] * 2
+
+		with self.assertRaises(ServiceUnavailableError):
+			transport.get_json(self.url)
+
+		time.sleep(0.5)
+
+		with self.assertRaises(ServiceUnavailableError):
+			transport.get_json(self.url)
+
+		self.assertEqual(breaker.state(), "open")
+
+
+	def test_unexpected_error_releases_the_trial(self):
+		transport = self.make_transport(max_retries=0, failure_threshold=1, reset_timeout=0.5)
+		breaker = transport.get_circuit_breaker(self.url)
+		self.server.faults = [(503, {})]
+
+		with self.assertRaises(ServiceUnavailableError):
+			transport.get_json(self.url)
+
+		time.sleep(0.5)
+
+		session = transport._get_session(self.url)
+		session.get = lambda *args, **kwargs: 1 / 0
+
+		with self.assertRaises(ZeroDivisionError):
+			transport.get_json(self.url)
+
+		del session.get
+
+		self.assertTrue(breaker.allow())
+		breaker.release_trial()
+
+		self.assertEqual(transport.get_json(self.url), {'status': 200})
+		self.assertEqual(breaker.state(), "closed")
+
+
+if __name__ == '__main__':
+	unittest.main()